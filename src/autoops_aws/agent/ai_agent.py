@@ -3,17 +3,64 @@ Core AI Agent using Google's Gemini model.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
-from google import genai
+import re
+from collections import OrderedDict
+from typing import ClassVar, Dict, Any, List, Optional, Tuple
 from ..tools.cost_analyzer import CostAnalyzer
 from ..tools.terraform_generator import TerraformGenerator
 from ..tools.aws_auditor import AWSAuditor
 
 logger = logging.getLogger(__name__)
 
+# Keywords that map an AI response to an action, one named group per action
+_ACTION_PATTERN = re.compile(
+    r"(?P<audit>audit)"
+    r"|(?P<analyze_costs>cost|analyze)"
+    r"|(?P<generate_terraform>terraform|infrastructure)"
+    r"|(?P<optimize>optimize)",
+    re.IGNORECASE
+)
+
+# Order in which actions win when a response mentions several of them
+_ACTION_PRIORITY = ("audit", "analyze_costs", "generate_terraform", "optimize")
+
+# Maximum number of responses kept in the per-agent response cache
+RESPONSE_CACHE_SIZE = 128
+
 class AWSAIAgent:
     """Main AI agent class that coordinates all AWS operations."""
     
+    # Available commands and their descriptions
+    _COMMANDS: ClassVar[Dict[str, str]] = {
+        "audit": "Audit AWS resources for security and cost optimization",
+        "analyze_costs": "Analyze current AWS costs and usage",
+        "generate_terraform": "Generate Terraform code for AWS infrastructure",
+        "optimize": "Get cost optimization recommendations",
+        "help": "Show available commands"
+    }
+    _COMMANDS_HELP: ClassVar[str] = "\n".join(
+        f"- {cmd}: {desc}" for cmd, desc in _COMMANDS.items()
+    )
+    
+    # System context for better understanding
+    _SYSTEM_PROMPT: ClassVar[str] = """
+You are an AWS DevOps AI assistant. Your role is to:
+1. Understand user requests about AWS infrastructure
+2. Determine which tools to use (audit, cost analysis, Terraform generation)
+3. Provide clear, actionable responses
+4. Always ask for confirmation before making changes
+
+Available tools:
+- AWS Auditor: Security and compliance checks
+- Cost Analyzer: Usage and cost optimization
+- Terraform Generator: Infrastructure as Code
+
+Respond with:
+1. Your understanding of the request
+2. The tool(s) you'll use
+3. Any additional information needed
+"""
+    
     def __init__(self, api_key: str):
         """
         Initialize the AI agent.
@@ -21,7 +68,8 @@ class AWSAIAgent:
         Args:
             api_key: Google API key for Gemini
         """
-        # Initialize Gemini
+        # Initialize Gemini (imported here to keep module import cheap)
+        from google import genai
         genai.configure(api_key=api_key)
         self.client = genai.Client()
         self.model = 'gemini-pro'
@@ -32,16 +80,18 @@ class AWSAIAgent:
         self.aws_auditor = AWSAuditor()
         
         # Create chat session
-        self.chat = self.client.chats.create(model=self.model)
+        self.chat = self.client.chats.create(
+            model=self.model,
+            config={"system_instruction": self._SYSTEM_PROMPT}
+        )
         
-        # Define available commands and their descriptions
-        self.commands = {
-            "audit": "Audit AWS resources for security and cost optimization",
-            "analyze_costs": "Analyze current AWS costs and usage",
-            "generate_terraform": "Generate Terraform code for AWS infrastructure",
-            "optimize": "Get cost optimization recommendations",
-            "help": "Show available commands"
-        }
+        # Gemini's (understanding, action, parameters) for previously seen
+        # messages, keyed by normalized text
+        self._response_cache: "OrderedDict[str, Tuple[str, str, Dict[str, Any]]]" = OrderedDict()
+    
+    def clear_cache(self) -> None:
+        """Forget all cached interpretations of messages."""
+        self._response_cache.clear()
     
     async def process_message(self, message: str) -> Dict[str, Any]:
         """
@@ -53,39 +103,33 @@ class AWSAIAgent:
         Returns:
             Dict containing the response and any actions to take
         """
+        cache_key = " ".join(message.lower().split())
+        
         try:
-            # Add system context for better understanding
-            system_prompt = """
-            You are an AWS DevOps AI assistant. Your role is to:
-            1. Understand user requests about AWS infrastructure
-            2. Determine which tools to use (audit, cost analysis, Terraform generation)
-            3. Provide clear, actionable responses
-            4. Always ask for confirmation before making changes
-            
-            Available tools:
-            - AWS Auditor: Security and compliance checks
-            - Cost Analyzer: Usage and cost optimization
-            - Terraform Generator: Infrastructure as Code
-            
-            Respond with:
-            1. Your understanding of the request
-            2. The tool(s) you'll use
-            3. Any additional information needed
-            """
-            
-            # Send message to Gemini
-            response = self.chat.send_message(
-                f"{system_prompt}\n\nUser request: {message}"
-            )
-            
-            # Parse the response to determine the action
-            action_type, parameters = self._parse_ai_response(response.text)
+            # Repeated questions reuse Gemini's interpretation; the action
+            # itself always runs so results reflect the current account
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                understanding, action_type, parameters = cached
+            else:
+                # The system prompt is set once on the chat session, so only the
+                # user's message is sent and the prompt prefix stays stable
+                response = self.chat.send_message(message)
+                understanding = response.text
+                
+                # Parse the response to determine the action
+                action_type, parameters = self._parse_ai_response(understanding)
+                
+                self._response_cache[cache_key] = (understanding, action_type, parameters)
+                if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
             
             # Execute the appropriate action
-            result = await self._execute_action(action_type, parameters)
+            result = await self._execute_action(action_type, dict(parameters))
             
             return {
-                "understanding": response.text,
+                "understanding": understanding,
                 "action": action_type,
                 "result": result
             }
@@ -108,19 +152,16 @@ class AWSAIAgent:
             Tuple of (action_type, parameters)
         """
         # TODO: Implement more sophisticated parsing
-        # For now, use simple keyword matching
-        response_lower = response.lower()
+        # For now, use keyword matching in a single pass over the response
+        found = {match.lastgroup for match in _ACTION_PATTERN.finditer(response)}
+        
+        for action_type in _ACTION_PRIORITY:
+            if action_type in found:
+                if action_type == "generate_terraform":
+                    return action_type, {"description": response}
+                return action_type, {}
         
-        if "audit" in response_lower:
-            return "audit", {}
-        elif "cost" in response_lower or "analyze" in response_lower:
-            return "analyze_costs", {}
-        elif "terraform" in response_lower or "infrastructure" in response_lower:
-            return "generate_terraform", {"description": response}
-        elif "optimize" in response_lower:
-            return "optimize", {}
-        else:
-            return "unknown", {"response": response}
+        return "unknown", {"response": response}
     
     async def _execute_action(
         self,
@@ -156,4 +197,4 @@ class AWSAIAgent:
     
     def get_available_commands(self) -> str:
         """Get formatted string of available commands."""
-        return "\n".join(f"- {cmd}: {desc}" for cmd, desc in self.commands.items()) 
\ No newline at end of file
+        return self._COMMANDS_HELP
\ No newline at end of file
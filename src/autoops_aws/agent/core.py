@@ -5,58 +5,93 @@ This module implements the main AI agent that combines DevOps and Cloud Engineer
 capabilities to provide an intelligent assistant for AWS operations.
 """
 
+import itertools
 import logging
-from typing import Dict, Any, List, Optional
+import time
+from collections import deque
+from typing import ClassVar, Deque, Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
+from ..serialization import dumps
 from ..roles.devops import DevOpsCapabilities
 from ..roles.cloud_engineer import CloudEngineerCapabilities
 
 logger = logging.getLogger(__name__)
 
+# Role identifiers stored in conversation history entries
+ROLE_USER = 0
+ROLE_ASSISTANT = 1
+_ROLE_NAMES = ("user", "assistant")
+
+# Maximum number of history entries kept per conversation
+MAX_HISTORY = 1000
+
+# Source of in-process conversation numbers
+_conversation_counter = itertools.count(1)
+
+def _new_history() -> Deque[Tuple[int, Any, float]]:
+    """Create an empty, bounded conversation history."""
+    return deque(maxlen=MAX_HISTORY)
+
 @dataclass
 class Conversation:
     """Represents a conversation with the AI agent."""
+    # Declared by hand (instead of slots=True) to keep Python 3.8 support
+    __slots__ = ("id", "start_time", "context", "history")
+    
     id: str
     start_time: datetime
     context: Dict[str, Any]
-    history: List[Dict[str, Any]]
+    # Entries are (role, content, unix timestamp) tuples
+    history: Deque[Tuple[int, Any, float]]
+    
+    @property
+    def messages(self) -> List[Dict[str, Any]]:
+        """Return the history as a list of dicts for serialization."""
+        return [
+            {
+                "role": _ROLE_NAMES[role],
+                "content": content,
+                "timestamp": datetime.fromtimestamp(timestamp)
+            }
+            for role, content, timestamp in self.history
+        ]
 
 class AWSOperationsAgent:
     """Main AI agent class combining DevOps and Cloud Engineering capabilities."""
     
+    # Common tasks and the names of their handler methods
+    _TASK_HANDLER_NAMES: ClassVar[Dict[str, str]] = {
+        # Infrastructure tasks
+        "create_infrastructure": "_handle_infrastructure_creation",
+        "update_infrastructure": "_handle_infrastructure_update",
+        "destroy_infrastructure": "_handle_infrastructure_destruction",
+        
+        # Application deployment tasks
+        "deploy_application": "_handle_application_deployment",
+        "rollback_deployment": "_handle_deployment_rollback",
+        "scale_application": "_handle_application_scaling",
+        
+        # Monitoring and maintenance tasks
+        "setup_monitoring": "_handle_monitoring_setup",
+        "investigate_issue": "_handle_issue_investigation",
+        "optimize_resources": "_handle_resource_optimization",
+        
+        # Security tasks
+        "security_audit": "_handle_security_audit",
+        "update_security": "_handle_security_update",
+        
+        # Cost management tasks
+        "analyze_costs": "_handle_cost_analysis",
+        "optimize_costs": "_handle_cost_optimization"
+    }
+    
     def __init__(self):
         """Initialize the AI agent with all capabilities."""
         self.devops = DevOpsCapabilities()
         self.cloud = CloudEngineerCapabilities()
         self.conversations: Dict[str, Conversation] = {}
-        
-        # Define common tasks and their handlers
-        self.task_handlers = {
-            # Infrastructure tasks
-            "create_infrastructure": self._handle_infrastructure_creation,
-            "update_infrastructure": self._handle_infrastructure_update,
-            "destroy_infrastructure": self._handle_infrastructure_destruction,
-            
-            # Application deployment tasks
-            "deploy_application": self._handle_application_deployment,
-            "rollback_deployment": self._handle_deployment_rollback,
-            "scale_application": self._handle_application_scaling,
-            
-            # Monitoring and maintenance tasks
-            "setup_monitoring": self._handle_monitoring_setup,
-            "investigate_issue": self._handle_issue_investigation,
-            "optimize_resources": self._handle_resource_optimization,
-            
-            # Security tasks
-            "security_audit": self._handle_security_audit,
-            "update_security": self._handle_security_update,
-            
-            # Cost management tasks
-            "analyze_costs": self._handle_cost_analysis,
-            "optimize_costs": self._handle_cost_optimization
-        }
     
     async def start_conversation(self, user_id: str) -> str:
         """
@@ -69,10 +104,10 @@ class AWSOperationsAgent:
             Conversation ID
         """
         conversation = Conversation(
-            id=f"conv_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{user_id}",
+            id=f"conv_{next(_conversation_counter)}_{user_id}",
             start_time=datetime.now(),
             context={},
-            history=[]
+            history=_new_history()
         )
         self.conversations[conversation.id] = conversation
         return conversation.id
@@ -94,25 +129,25 @@ class AWSOperationsAgent:
         Returns:
             Dict containing the agent's response and any actions
         """
+        now = time.time()
+        
         # Update conversation context
         conversation = self.conversations[conversation_id]
         if context:
             conversation.context.update(context)
         
         # Add message to history
-        conversation.history.append({
-            "role": "user",
-            "content": message,
-            "timestamp": datetime.now()
-        })
+        conversation.history.append((ROLE_USER, message, now))
         
         try:
             # Analyze the message and determine required actions
             task_type, parameters = await self._analyze_message(message, conversation.context)
             
             # Execute the appropriate task handler
-            if task_type in self.task_handlers:
-                response = await self.task_handlers[task_type](parameters, conversation.context)
+            handler_name = self._TASK_HANDLER_NAMES.get(task_type)
+            handler = getattr(self, handler_name, None) if handler_name else None
+            if handler is not None:
+                response = await handler(parameters, conversation.context)
             else:
                 response = {
                     "message": "I'm not sure how to help with that specific task. Could you please rephrase or provide more details?",
@@ -120,11 +155,7 @@ class AWSOperationsAgent:
                 }
             
             # Add response to history
-            conversation.history.append({
-                "role": "assistant",
-                "content": response,
-                "timestamp": datetime.now()
-            })
+            conversation.history.append((ROLE_ASSISTANT, response, now))
             
             return response
             
@@ -234,4 +265,8 @@ class AWSOperationsAgent:
             "message": response.get("message", "Task completed successfully."),
             "details": response,
             "timestamp": datetime.now().isoformat()
-        } 
\ No newline at end of file
+        }
+    
+    def serialize_response(self, response: Dict[str, Any]) -> bytes:
+        """Format a response and encode it as JSON for transport."""
+        return dumps(self._format_response(response)) 
\ No newline at end of file
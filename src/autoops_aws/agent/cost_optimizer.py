@@ -4,21 +4,70 @@ AWS Cost Optimization Agent.
 This module provides basic AWS cost analysis and optimization recommendations.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List
-import boto3
+from datetime import datetime, timedelta, timezone
+from functools import cached_property, lru_cache
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 from botocore.exceptions import ClientError
 
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+
 logger = logging.getLogger(__name__)
 
+# Example EBS storage rate used for savings estimates (USD per GB-month)
+COST_PER_GB_MONTH = 0.10
+
+# Window used to judge EC2 utilization
+CPU_LOOKBACK = timedelta(days=14)
+
+# Maximum number of queries CloudWatch accepts in one GetMetricData call
+MAX_METRIC_QUERIES = 500
+
+@lru_cache(maxsize=128)
+def _format_recommendations(recommendations: Tuple[Tuple[Tuple[str, Any], ...], ...]) -> str:
+    """Format a frozen sequence of recommendation items for display."""
+    if not recommendations:
+        return "No optimization recommendations found."
+    
+    parts = ["Cost Optimization Recommendations:\n\n"]
+    for i, items in enumerate(recommendations, 1):
+        rec = dict(items)
+        parts.append(
+            f"{i}. {rec['type']} - {rec['resource_id']}\n"
+            f"   Recommendation: {rec['recommendation']}\n"
+            f"   Potential Savings: {rec['potential_savings']}\n\n"
+        )
+    
+    return "".join(parts)
+
 class CostOptimizer:
     """Handles AWS cost analysis and optimization."""
     
-    def __init__(self):
-        """Initialize the cost optimizer."""
-        self.cost_explorer = boto3.client('ce')
-        self.ec2 = boto3.client('ec2')
-        self.rds = boto3.client('rds')
+    @cached_property
+    def cost_explorer(self) -> "BaseClient":
+        """Cost Explorer client, created on first use."""
+        import boto3
+        return boto3.client('ce')
+    
+    @cached_property
+    def ec2(self) -> "BaseClient":
+        """EC2 client, created on first use."""
+        import boto3
+        return boto3.client('ec2')
+    
+    @cached_property
+    def rds(self) -> "BaseClient":
+        """RDS client, created on first use."""
+        import boto3
+        return boto3.client('rds')
+    
+    @cached_property
+    def cloudwatch(self) -> "BaseClient":
+        """CloudWatch client, created on first use."""
+        import boto3
+        return boto3.client('cloudwatch')
     
     async def analyze_current_costs(self, time_period: Dict[str, str]) -> Dict[str, Any]:
         """
@@ -31,22 +80,35 @@ class CostOptimizer:
             Dict containing cost analysis
         """
         try:
-            # Get cost and usage data
-            response = self.cost_explorer.get_cost_and_usage(
-                TimePeriod=time_period,
-                Granularity='MONTHLY',
-                Metrics=['UnblendedCost'],
-                GroupBy=[
+            request = {
+                "TimePeriod": time_period,
+                "Granularity": 'MONTHLY',
+                "Metrics": ['UnblendedCost'],
+                "GroupBy": [
                     {'Type': 'DIMENSION', 'Key': 'SERVICE'},
                     {'Type': 'DIMENSION', 'Key': 'USAGE_TYPE'}
                 ]
-            )
+            }
+            
+            # Cost Explorer has no botocore paginator, so follow NextPageToken
+            # and fold the total in the same pass over the results
+            results = []
+            total = 0.0
+            while True:
+                response = self.cost_explorer.get_cost_and_usage(**request)
+                for result in response['ResultsByTime']:
+                    results.append(result)
+                    for group in result['Groups']:
+                        total += float(group['Metrics']['UnblendedCost']['Amount'])
+                
+                next_token = response.get('NextPageToken')
+                if not next_token:
+                    break
+                request["NextPageToken"] = next_token
             
             return {
-                "costs": response['ResultsByTime'],
-                "total": sum(float(group['Metrics']['UnblendedCost']['Amount'])
-                           for result in response['ResultsByTime']
-                           for group in result['Groups'])
+                "costs": results,
+                "total": total
             }
             
         except ClientError as e:
@@ -60,58 +122,144 @@ class CostOptimizer:
         Returns:
             List of recommendations
         """
-        recommendations = []
+        # Create the clients up front; boto3 client creation is not thread-safe
+        self.ec2, self.rds, self.cloudwatch
         
         try:
-            # Check for unused EC2 instances
-            ec2_instances = self.ec2.describe_instances()
-            for reservation in ec2_instances['Reservations']:
+            # The three services are independent, so overlap their round trips
+            loop = asyncio.get_running_loop()
+            ec2_recs, ebs_recs, rds_recs = await asyncio.gather(
+                loop.run_in_executor(None, self._get_ec2_recommendations),
+                loop.run_in_executor(None, self._get_ebs_recommendations),
+                loop.run_in_executor(None, self._get_rds_recommendations)
+            )
+                
+        except ClientError as e:
+            logger.error(f"Error getting recommendations: {e}")
+            raise
+        
+        return ec2_recs + ebs_recs + rds_recs
+    
+    def _get_ec2_recommendations(self) -> List[Dict[str, Any]]:
+        """Check for unused EC2 instances."""
+        # Collect IDs for the CloudWatch batch and the recommendations
+        # themselves in the same pass over the reservations
+        instance_ids = []
+        recommendations = []
+        instance_pages = self.ec2.get_paginator('describe_instances').paginate(
+            PaginationConfig={'PageSize': 1000}
+        )
+        for page in instance_pages:
+            for reservation in page['Reservations']:
                 for instance in reservation['Instances']:
                     if instance['State']['Name'] == 'running':
-                        # Check CPU utilization (you'd typically want to check CloudWatch metrics)
+                        instance_ids.append(instance['InstanceId'])
                         recommendations.append({
                             "type": "EC2",
                             "resource_id": instance['InstanceId'],
                             "recommendation": "Review if this instance is needed",
                             "potential_savings": "Varies based on instance type"
                         })
+        
+        average_cpu = self._get_average_cpu(instance_ids)
+        for instance_id, rec in zip(instance_ids, recommendations):
+            cpu = average_cpu.get(instance_id)
+            if cpu is not None:
+                rec["recommendation"] += (
+                    f" (average CPU {cpu:.1f}% over the last {CPU_LOOKBACK.days} days)"
+                )
+        return recommendations
+    
+    def _get_average_cpu(self, instance_ids: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Get average CPU utilization for EC2 instances.
+        
+        Queries are batched into as few GetMetricData calls as possible
+        rather than issuing one request per instance.
+        
+        Args:
+            instance_ids: IDs of the instances to check
             
-            # Check for unattached EBS volumes
-            volumes = self.ec2.describe_volumes()
-            for volume in volumes['Volumes']:
-                if not volume['Attachments']:
-                    recommendations.append({
-                        "type": "EBS",
-                        "resource_id": volume['VolumeId'],
-                        "recommendation": "Delete unused EBS volume",
-                        "potential_savings": f"${float(volume['Size']) * 0.10}/month"  # Example rate
-                    })
-            
-            # Add RDS optimization recommendations
-            rds_instances = self.rds.describe_db_instances()
-            for instance in rds_instances['DBInstances']:
+        Returns:
+            Dict mapping instance ID to average CPU percent, or None if no data;
+            empty if CloudWatch could not be queried
+        """
+        average_cpu: Dict[str, Optional[float]] = {}
+        end_time = datetime.now(timezone.utc)
+        start_time = end_time - CPU_LOOKBACK
+        period = int(CPU_LOOKBACK.total_seconds())
+        paginator = self.cloudwatch.get_paginator('get_metric_data')
+        
+        # CPU figures are optional detail; without CloudWatch access the
+        # recommendations are still returned, just without them
+        try:
+            for offset in range(0, len(instance_ids), MAX_METRIC_QUERIES):
+                batch = instance_ids[offset:offset + MAX_METRIC_QUERIES]
+                queries = [
+                    {
+                        'Id': f"m{i}",
+                        'MetricStat': {
+                            'Metric': {
+                                'Namespace': 'AWS/EC2',
+                                'MetricName': 'CPUUtilization',
+                                'Dimensions': [{'Name': 'InstanceId', 'Value': instance_id}]
+                            },
+                            'Period': period,
+                            'Stat': 'Average'
+                        }
+                    }
+                    for i, instance_id in enumerate(batch)
+                ]
+                
+                for page in paginator.paginate(
+                    MetricDataQueries=queries,
+                    StartTime=start_time,
+                    EndTime=end_time
+                ):
+                    for result in page['MetricDataResults']:
+                        values = result['Values']
+                        if values:
+                            average_cpu[batch[int(result['Id'][1:])]] = sum(values) / len(values)
+        
+        except ClientError as e:
+            logger.error(f"Error getting CPU utilization: {e}")
+            return {}
+        
+        return average_cpu
+    
+    def _get_ebs_recommendations(self) -> List[Dict[str, Any]]:
+        """Check for unattached EBS volumes ("available" means not attached)."""
+        recommendations = []
+        volume_pages = self.ec2.get_paginator('describe_volumes').paginate(
+            Filters=[{'Name': 'status', 'Values': ['available']}],
+            PaginationConfig={'PageSize': 500}
+        )
+        for page in volume_pages:
+            for volume in page['Volumes']:
+                recommendations.append({
+                    "type": "EBS",
+                    "resource_id": volume['VolumeId'],
+                    "recommendation": "Delete unused EBS volume",
+                    "potential_savings": f"${volume['Size'] * COST_PER_GB_MONTH:.2f}/month"
+                })
+        return recommendations
+    
+    def _get_rds_recommendations(self) -> List[Dict[str, Any]]:
+        """Add RDS optimization recommendations."""
+        recommendations = []
+        db_pages = self.rds.get_paginator('describe_db_instances').paginate(
+            PaginationConfig={'PageSize': 100}
+        )
+        for page in db_pages:
+            for instance in page['DBInstances']:
                 recommendations.append({
                     "type": "RDS",
                     "resource_id": instance['DBInstanceIdentifier'],
                     "recommendation": "Consider scaling down during non-peak hours",
                     "potential_savings": "20-50% of instance cost"
                 })
-                
-        except ClientError as e:
-            logger.error(f"Error getting recommendations: {e}")
-            raise
-        
         return recommendations
     
     def format_recommendations(self, recommendations: List[Dict[str, Any]]) -> str:
         """Format recommendations for display."""
-        if not recommendations:
-            return "No optimization recommendations found."
-        
-        formatted = "Cost Optimization Recommendations:\n\n"
-        for i, rec in enumerate(recommendations, 1):
-            formatted += f"{i}. {rec['type']} - {rec['resource_id']}\n"
-            formatted += f"   Recommendation: {rec['recommendation']}\n"
-            formatted += f"   Potential Savings: {rec['potential_savings']}\n\n"
-        
-        return formatted 
\ No newline at end of file
+        return _format_recommendations(tuple(tuple(rec.items()) for rec in recommendations))
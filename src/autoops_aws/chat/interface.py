@@ -3,30 +3,27 @@ Chat interface module for interacting with the AWS Operations Agent.
 """
 
 import asyncio
-import uuid
-from typing import Optional, Dict, Any
-from rich.console import Console
-from rich.prompt import Prompt, Confirm
-from rich.markdown import Markdown
-from rich.syntax import Syntax
-from rich.panel import Panel
+import time
+from functools import lru_cache
+from typing import Optional, Dict, Any, TYPE_CHECKING
 
 from ..agent.core import AWSOperationsAgent
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.markdown import Markdown
 
-class ChatInterface:
-    """Interactive chat interface for the AWS Operations Agent."""
-    
-    def __init__(self):
-        """Initialize the chat interface."""
-        self.agent = AWSOperationsAgent()
-        self.user_id = str(uuid.uuid4())
-        self.conversation_id: Optional[str] = None
-        
-    def _display_welcome(self):
-        """Display welcome message and instructions."""
-        welcome_text = """
+_console: Optional["Console"] = None
+
+def _get_console() -> "Console":
+    """Return the shared Rich console, importing Rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+_WELCOME_TEXT = """
 # AWS Operations Assistant
 
 I'm your AI-powered DevOps and Cloud Engineering assistant. I can help you with:
@@ -56,17 +53,80 @@ I'm your AI-powered DevOps and Cloud Engineering assistant. I can help you with:
 
 Type 'help' for available commands or 'exit' to quit.
 """
-        console.print(Markdown(welcome_text))
+
+_HELP_TEXT = """
+## Available Commands
+
+### Infrastructure
+- create infrastructure <description>
+- update infrastructure <description>
+- destroy infrastructure <name>
+
+### Applications
+- deploy application <details>
+- rollback deployment <service>
+- scale application <service>
+
+### Monitoring
+- setup monitoring <resources>
+- investigate issue <description>
+- optimize resources <targets>
+
+### Security
+- audit security <scope>
+- update security <requirements>
+
+### Cost Management
+- analyze costs
+- optimize costs <target>
+
+### General
+- help - Show this help message
+- exit - Exit the application
+"""
+
+@lru_cache(maxsize=None)
+def _get_markdown(text: str) -> "Markdown":
+    """Parse static Markdown text once and reuse the result."""
+    from rich.markdown import Markdown
+    return Markdown(text)
+
+def __getattr__(name: str) -> Any:
+    """Resolve the module-level ``console`` lazily."""
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+class ChatInterface:
+    """Interactive chat interface for the AWS Operations Agent."""
+    
+    def __init__(self):
+        """Initialize the chat interface."""
+        self.agent = AWSOperationsAgent()
+        self.user_id = f"u{time.monotonic_ns()}"
+        self.conversation_id: Optional[str] = None
+    
+    @property
+    def _console(self) -> "Console":
+        """Rich console used for all output."""
+        return _get_console()
+        
+    def _display_welcome(self):
+        """Display welcome message and instructions."""
+        self._console.print(_get_markdown(_WELCOME_TEXT))
     
     def _display_code(self, code: str, language: str = "terraform"):
         """Display code with syntax highlighting."""
+        from rich.panel import Panel
+        from rich.syntax import Syntax
         syntax = Syntax(code, language, theme="monokai", line_numbers=True)
-        console.print(Panel(syntax, title=f"{language.capitalize()} Code"))
+        self._console.print(Panel(syntax, title=f"{language.capitalize()} Code"))
     
     def _display_architecture(self, architecture: Dict[str, Any]):
         """Display architecture diagram and details."""
+        from rich.panel import Panel
         # TODO: Implement architecture visualization
-        console.print(Panel(str(architecture), title="Architecture Design"))
+        self._console.print(Panel(str(architecture), title="Architecture Design"))
     
     async def _get_user_approval(self, action: str, details: Dict[str, Any]) -> bool:
         """
@@ -79,7 +139,8 @@ Type 'help' for available commands or 'exit' to quit.
         Returns:
             Boolean indicating approval
         """
-        console.print(f"\n[yellow]Action requires approval:[/yellow] {action}")
+        from rich.prompt import Confirm
+        self._console.print(f"\n[yellow]Action requires approval:[/yellow] {action}")
         
         if "code" in details:
             self._display_code(details["code"])
@@ -90,37 +151,7 @@ Type 'help' for available commands or 'exit' to quit.
     
     async def _process_help(self):
         """Display help information."""
-        help_text = """
-## Available Commands
-
-### Infrastructure
-- create infrastructure <description>
-- update infrastructure <description>
-- destroy infrastructure <name>
-
-### Applications
-- deploy application <details>
-- rollback deployment <service>
-- scale application <service>
-
-### Monitoring
-- setup monitoring <resources>
-- investigate issue <description>
-- optimize resources <targets>
-
-### Security
-- audit security <scope>
-- update security <requirements>
-
-### Cost Management
-- analyze costs
-- optimize costs <target>
-
-### General
-- help - Show this help message
-- exit - Exit the application
-"""
-        console.print(Markdown(help_text))
+        self._console.print(_get_markdown(_HELP_TEXT))
     
     async def run(self):
         """Run the chat interface."""
@@ -132,7 +163,7 @@ Type 'help' for available commands or 'exit' to quit.
         while True:
             try:
                 # Get user input
-                user_input = console.input("[bold green]>>> [/bold green]")
+                user_input = self._console.input("[bold green]>>> [/bold green]")
                 
                 # Handle built-in commands
                 if user_input.lower() == "exit":
@@ -149,12 +180,12 @@ Type 'help' for available commands or 'exit' to quit.
                 
                 # Handle response
                 if "error" in response:
-                    console.print(f"[red]Error:[/red] {response['error']}")
+                    self._console.print(f"[red]Error:[/red] {response['error']}")
                     continue
                 
                 # Display response
                 if "message" in response:
-                    console.print(response["message"])
+                    self._console.print(response["message"])
                 
                 # Handle actions that need approval
                 if "actions" in response:
@@ -165,16 +196,16 @@ Type 'help' for available commands or 'exit' to quit.
                                 self.conversation_id,
                                 action["id"]
                             )
-                            console.print(f"[green]Action completed:[/green] {result['message']}")
+                            self._console.print(f"[green]Action completed:[/green] {result['message']}")
                         else:
-                            console.print("[yellow]Action cancelled[/yellow]")
+                            self._console.print("[yellow]Action cancelled[/yellow]")
                 
             except KeyboardInterrupt:
-                console.print("\n[yellow]Use 'exit' to quit[/yellow]")
+                self._console.print("\n[yellow]Use 'exit' to quit[/yellow]")
             except Exception as e:
-                console.print(f"[red]An error occurred:[/red] {str(e)}")
+                self._console.print(f"[red]An error occurred:[/red] {str(e)}")
         
-        console.print("\n[blue]Goodbye![/blue]")
+        self._console.print("\n[blue]Goodbye![/blue]")
 
 def main():
     """Main entry point for the chat interface."""
@@ -0,0 +1,119 @@
+"""
+Shared Rich console, prompt reader and event loop runner for the CLI entry points.
+"""
+
+import asyncio
+import signal
+import threading
+from typing import Any, Coroutine, Optional
+from rich.console import Console
+
+# Created once so terminal detection runs a single time per process
+CONSOLE = Console()
+
+# Line being read by the prompt thread; kept across Ctrl-C so a new prompt
+# reuses the waiting reader instead of starting a second one on stdin
+_pending_line: Optional["asyncio.Future[str]"] = None
+
+# Set by the SIGINT handler while a prompt is waiting for input
+_interrupted: Optional["asyncio.Future[None]"] = None
+
+def _resolve(future: "asyncio.Future[Any]", result: Any = None, error: Optional[BaseException] = None) -> None:
+    """Complete a future unless it is already done."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+def _read_line(loop: asyncio.AbstractEventLoop, future: "asyncio.Future[str]", prompt: str) -> None:
+    """Read one line on the prompt thread and hand it to the event loop."""
+    line, error = None, None
+    try:
+        line = CONSOLE.input(prompt)
+    except Exception as e:
+        error = e
+    
+    try:
+        loop.call_soon_threadsafe(_resolve, future, line, error)
+    except RuntimeError:
+        # The loop closed while the user was typing
+        pass
+
+def _handle_sigint(signum: int, frame: Any) -> None:
+    """Interrupt a waiting prompt, or raise KeyboardInterrupt as usual."""
+    interrupted = _interrupted
+    if interrupted is not None and not interrupted.done():
+        interrupted.get_loop().call_soon_threadsafe(_resolve, interrupted)
+        return
+    signal.default_int_handler(signum, frame)
+
+async def read_input(prompt: str) -> str:
+    """
+    Read a line from the console without blocking the event loop.
+    
+    The line is read on a daemon thread, so a prompt left waiting never keeps
+    the process alive.
+    
+    Args:
+        prompt: Rich markup shown before the input
+        
+    Returns:
+        The line entered by the user
+        
+    Raises:
+        KeyboardInterrupt: If Ctrl-C is pressed while waiting for input
+    """
+    global _pending_line, _interrupted
+    loop = asyncio.get_running_loop()
+    
+    if _pending_line is None or _pending_line.get_loop() is not loop:
+        _pending_line = loop.create_future()
+        threading.Thread(
+            target=_read_line, args=(loop, _pending_line, prompt), daemon=True
+        ).start()
+    else:
+        # The reader from before Ctrl-C is still waiting; show the prompt again
+        CONSOLE.print(prompt, end="")
+    
+    _interrupted = loop.create_future()
+    try:
+        await asyncio.wait((_pending_line, _interrupted), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        _interrupted = None
+    
+    if not _pending_line.done():
+        raise KeyboardInterrupt
+    line, _pending_line = _pending_line, None
+    return line.result()
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine to completion, on uvloop when it is installed.
+    
+    Ctrl-C at a read_input prompt raises KeyboardInterrupt inside the
+    coroutine; elsewhere it behaves as usual.
+    
+    Args:
+        main: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    # Installed before the loop starts, so asyncio.run keeps this handler
+    # instead of cancelling the main task on SIGINT
+    previous = signal.signal(signal.SIGINT, _handle_sigint)
+    try:
+        try:
+            import uvloop
+        except ImportError:
+            return asyncio.run(main)
+        
+        # uvloop.run replaces the event loop policy hook deprecated in Python 3.12
+        if hasattr(uvloop, "run"):
+            return uvloop.run(main)
+        uvloop.install()
+        return asyncio.run(main)
+    finally:
+        signal.signal(signal.SIGINT, previous)
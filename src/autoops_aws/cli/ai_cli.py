@@ -2,31 +2,38 @@
 AI-powered CLI for AWS operations.
 """
 
-import asyncio
 import sys
-import os
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple, Union
 import click
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.syntax import Syntax
-from rich.panel import Panel
-from dotenv import load_dotenv
 
 from ..agent.ai_agent import AWSAIAgent
+from ..config import get_env
+from ..serialization import loads
+from ._console import CONSOLE as console, read_input, run
 
-console = Console()
+# Audit result sections: (path into the results, heading, label for each finding)
+_AUDIT_SECTIONS = (
+    (("iam", "users"), "IAM Issues Found", lambda user: f"User: {user['username']}"),
+    (("security_groups",), "Security Group Issues Found",
+     lambda sg: f"Group: {sg['group_name']} ({sg['group_id']})"),
+    (("s3",), "S3 Issues Found", lambda bucket: f"Bucket: {bucket['bucket_name']}"),
+)
+
+def _dig(results: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    """Follow a path of keys into nested audit results."""
+    for key in path:
+        results = results.get(key)
+        if not results:
+            return None
+    return results
 
 class AICLI:
     """AI-powered CLI for AWS operations."""
     
     def __init__(self):
         """Initialize the CLI."""
-        # Load environment variables
-        load_dotenv()
-        
-        # Get Google API key
-        api_key = os.getenv('GOOGLE_API_KEY')
+        # Get Google API key (.env is loaded on first access to the environment snapshot)
+        api_key = get_env().get('GOOGLE_API_KEY')
         if not api_key:
             raise ValueError("GOOGLE_API_KEY environment variable is required")
         
@@ -53,46 +60,52 @@ I'm your AI-powered AWS operations assistant. I can help you with:
 
 Type 'help' to see example commands or 'exit' to quit.
 """
+        from rich.markdown import Markdown
         console.print(Markdown(welcome_text))
     
     def _display_code(self, code: str, language: str = "terraform"):
         """Display code with syntax highlighting."""
+        from rich.panel import Panel
+        from rich.syntax import Syntax
         syntax = Syntax(code, language, theme="monokai", line_numbers=True)
         console.print(Panel(syntax, title=f"{language.capitalize()} Code"))
     
-    def _display_audit_results(self, results: dict):
+    def _display_audit_results(self, results: Union[Dict[str, Any], bytes, str]):
         """Display audit results in a formatted way."""
-        # Display IAM findings
-        if results.get("iam", {}).get("users"):
-            console.print("\n[bold red]IAM Issues Found:[/bold red]")
-            for user in results["iam"]["users"]:
-                console.print(f"User: {user['username']}")
-                for issue in user["issues"]:
-                    console.print(f"  - {issue}")
-        
-        # Display security group findings
-        if results.get("security_groups"):
-            console.print("\n[bold red]Security Group Issues Found:[/bold red]")
-            for sg in results["security_groups"]:
-                console.print(f"Group: {sg['group_name']} ({sg['group_id']})")
-                for issue in sg["issues"]:
-                    console.print(f"  - {issue}")
+        # Results may arrive already encoded as JSON
+        if isinstance(results, (bytes, str)):
+            results = loads(results)
         
-        # Display S3 findings
-        if results.get("s3"):
-            console.print("\n[bold red]S3 Issues Found:[/bold red]")
-            for bucket in results["s3"]:
-                console.print(f"Bucket: {bucket['bucket_name']}")
-                for issue in bucket["issues"]:
-                    console.print(f"  - {issue}")
+        # Display findings for each audited service
+        for path, heading, label in _AUDIT_SECTIONS:
+            findings = _dig(results, path)
+            if findings:
+                lines = [f"\n[bold red]{heading}:[/bold red]"]
+                for finding in findings:
+                    lines.append(label(finding))
+                    lines.extend(f"  - {issue}" for issue in finding["issues"])
+                console.print("\n".join(lines))
         
         # Display recommendations
         if results.get("recommendations"):
-            console.print("\n[bold yellow]Recommendations:[/bold yellow]")
+            from rich.table import Table
+            table = Table(title="Recommendations")
+            table.add_column("Category", style="cyan")
+            table.add_column("Service", style="magenta")
+            table.add_column("Priority", style="yellow")
+            table.add_column("Description")
+            table.add_column("Details")
+            
             for rec in results["recommendations"]:
-                console.print(f"\n[bold]{rec['category']} - {rec['service']} (Priority: {rec['priority']})[/bold]")
-                console.print(f"Description: {rec['description']}")
-                console.print(f"Details: {rec['details']}")
+                table.add_row(
+                    rec['category'],
+                    rec['service'],
+                    rec['priority'],
+                    rec['description'],
+                    rec['details']
+                )
+            
+            console.print(table)
     
     async def run(self):
         """Run the CLI interface."""
@@ -101,7 +114,7 @@ Type 'help' to see example commands or 'exit' to quit.
         while True:
             try:
                 # Get user input
-                user_input = console.input("\n[bold green]>>> [/bold green]")
+                user_input = await read_input("\n[bold green]>>> [/bold green]")
                 
                 # Handle built-in commands
                 if user_input.lower() == "exit":
@@ -144,7 +157,7 @@ def main():
     """Main entry point for the CLI."""
     try:
         cli = AICLI()
-        asyncio.run(cli.run())
+        run(cli.run())
     except Exception as e:
         console.print(f"[red]Fatal error:[/red] {str(e)}")
         sys.exit(1)
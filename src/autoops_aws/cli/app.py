@@ -2,21 +2,52 @@
 Main CLI application module.
 """
 
-import asyncio
 import sys
 import logging
-from typing import Optional
+from functools import lru_cache
+from operator import itemgetter, methodcaller
+from typing import Optional, TYPE_CHECKING
 import click
-from rich.console import Console
-from rich.prompt import Confirm
-from rich.table import Table
 
 from .interface import CLIInterface
 from .command import CommandType
+from ._console import CONSOLE as console, read_input, run
+
+if TYPE_CHECKING:
+    from rich.table import Table
 
-console = Console()
 logger = logging.getLogger(__name__)
 
+# Descriptions shown by the help command
+_HELP_COMMANDS = {
+    "list ec2 instances": "List all EC2 instances in the current region",
+    "terminate ec2 instance <id>": "Terminate a specific EC2 instance",
+    "create s3 bucket <name>": "Create a new S3 bucket",
+    "list s3 buckets": "List all S3 buckets",
+    "help": "Show this help message",
+    "exit": "Exit the application"
+}
+
+# Accessors for AWS result rows
+_BUCKET_NAME = itemgetter("Name")
+_CREATION_DATE = itemgetter("CreationDate")
+_ISOFORMAT = methodcaller("isoformat")
+_INSTANCE_ID_AND_TYPE = itemgetter("InstanceId", "InstanceType")
+_STATE = itemgetter("State")
+
+@lru_cache(maxsize=1)
+def _get_help_table() -> "Table":
+    """Build the static help table once."""
+    from rich.table import Table
+    table = Table(title="Available Commands")
+    table.add_column("Command", style="cyan")
+    table.add_column("Description", style="green")
+    
+    for command, description in _HELP_COMMANDS.items():
+        table.add_row(command, description)
+    
+    return table
+
 class CLIApp:
     """Main CLI application class."""
     
@@ -32,39 +63,25 @@ class CLIApp:
     
     def _display_help(self, help_info):
         """Display help information in a formatted table."""
-        table = Table(title="Available Commands")
-        table.add_column("Command", style="cyan")
-        table.add_column("Description", style="green")
-        
-        commands = {
-            "list ec2 instances": "List all EC2 instances in the current region",
-            "terminate ec2 instance <id>": "Terminate a specific EC2 instance",
-            "create s3 bucket <name>": "Create a new S3 bucket",
-            "list s3 buckets": "List all S3 buckets",
-            "help": "Show this help message",
-            "exit": "Exit the application"
-        }
-        
-        for command in help_info["available_commands"]:
-            table.add_row(command, commands.get(command, ""))
-        
-        console.print(table)
+        console.print(_get_help_table())
     
     def _display_aws_result(self, result):
         """Display AWS command results in a formatted way."""
         if not result:
             return
-            
+        
+        from rich.table import Table
+        
         if "Buckets" in result:
             table = Table(title="S3 Buckets")
             table.add_column("Bucket Name", style="cyan")
             table.add_column("Creation Date", style="green")
             
-            for bucket in result["Buckets"]:
-                table.add_row(
-                    bucket["Name"],
-                    str(bucket["CreationDate"])
-                )
+            buckets = result["Buckets"]
+            names = map(_BUCKET_NAME, buckets)
+            dates = map(_ISOFORMAT, map(_CREATION_DATE, buckets))
+            for row in zip(names, dates):
+                table.add_row(*row)
             console.print(table)
         elif "Instances" in result:
             table = Table(title="EC2 Instances")
@@ -73,17 +90,15 @@ class CLIApp:
             table.add_column("Type", style="blue")
             
             for instance in result["Instances"]:
-                table.add_row(
-                    instance["InstanceId"],
-                    instance["State"]["Name"],
-                    instance["InstanceType"]
-                )
+                instance_id, instance_type = _INSTANCE_ID_AND_TYPE(instance)
+                table.add_row(instance_id, _STATE(instance)["Name"], instance_type)
             console.print(table)
         else:
             console.print(result)
     
     async def _get_user_approval(self, command) -> bool:
         """Get user approval for a command."""
+        from rich.prompt import Confirm
         console.print("\n[yellow]Command requires approval:[/yellow]")
         console.print(f"[bold]{str(command)}[/bold]")
         
@@ -98,7 +113,7 @@ class CLIApp:
         """
         try:
             # Parse the command
-            command = await self.interface.process_input(user_input)
+            command = self.interface.process_input(user_input)
             
             # Handle exit command
             if command.type == CommandType.EXIT:
@@ -115,7 +130,7 @@ class CLIApp:
                 if not await self._get_user_approval(command):
                     console.print("[yellow]Command cancelled by user[/yellow]")
                     return True
-                await self.interface.approve_command(command)
+                self.interface.approve_command(command)
             
             # Execute the command
             result = await self.interface.execute_command(command)
@@ -134,7 +149,7 @@ class CLIApp:
         
         while self.running:
             try:
-                user_input = console.input("[bold green]>>> [/bold green]")
+                user_input = await read_input("[bold green]>>> [/bold green]")
                 self.running = await self._process_command(user_input)
             except KeyboardInterrupt:
                 console.print("\n[yellow]Use 'exit' to quit[/yellow]")
@@ -149,7 +164,7 @@ def main():
     """Main entry point for the CLI application."""
     try:
         app = CLIApp()
-        asyncio.run(app.run())
+        run(app.run())
     except Exception as e:
         console.print(f"[red]Fatal error:[/red] {str(e)}")
         sys.exit(1)
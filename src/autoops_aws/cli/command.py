@@ -2,11 +2,15 @@
 Command module for representing CLI commands.
 """
 
+import sys
 from enum import Enum
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from typing import ClassVar, Dict, Any, Optional
+from dataclasses import dataclass, field
 from datetime import datetime
 
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 class CommandType(Enum):
     """Types of commands that can be executed."""
     AWS = "aws"
@@ -14,25 +18,33 @@ class CommandType(Enum):
     HELP = "help"
     EXIT = "exit"
 
-@dataclass
+@dataclass(**_SLOTS)
 class Command:
     """Represents a command to be executed."""
     
+    # Whether each command type always needs approval
+    _REQUIRES_APPROVAL: ClassVar[Dict["CommandType", bool]] = {
+        CommandType.AWS: True,
+        CommandType.SYSTEM: True,
+        CommandType.HELP: False,
+        CommandType.EXIT: False,
+    }
+    
     type: CommandType
     service: str
     action: str
     parameters: Dict[str, Any]
-    requires_approval: bool = True
+    # Derived from the command type in __post_init__
+    requires_approval: bool = field(init=False)
     is_approved: bool = False
     approved_at: Optional[datetime] = None
     approved_by: Optional[str] = None
+    # String form, computed on first use; none of the fields it uses change after creation
+    _str_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate command after initialization."""
-        if self.type == CommandType.AWS:
-            self.requires_approval = True
-        elif self.type == CommandType.HELP:
-            self.requires_approval = False
+        self.requires_approval = self._REQUIRES_APPROVAL[self.type]
     
     def approve(self, approver: str):
         """
@@ -47,7 +59,7 @@ class Command:
     
     def to_aws_command(self) -> Dict[str, Any]:
         """
-        Convert the command to AWS SDK format.
+        Convert the command to AWS SDK format for serialization.
         
         Returns:
             Dict containing the AWS SDK command parameters
@@ -63,8 +75,10 @@ class Command:
     
     def __str__(self) -> str:
         """Return string representation of the command."""
-        base = f"{self.type.value} command: {self.service} {self.action}"
-        if self.parameters:
-            params = " ".join(f"{k}={v}" for k, v in self.parameters.items())
-            base += f" with parameters: {params}"
-        return base 
\ No newline at end of file
+        if self._str_cache is None:
+            base = f"{self.type.value} command: {self.service} {self.action}"
+            if self.parameters:
+                params = " ".join(f"{k}={v}" for k, v in self.parameters.items())
+                base += f" with parameters: {params}"
+            self._str_cache = base
+        return self._str_cache 
\ No newline at end of file
@@ -4,18 +4,22 @@ Cost Optimization CLI.
 A simple command-line interface for AWS cost optimization.
 """
 
-import asyncio
 import sys
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Dict, Any
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.prompt import Confirm
 
 from ..agent.cost_optimizer import CostOptimizer
+from ._console import CONSOLE as console, read_input, run
 
-console = Console()
+# Accessors for Cost Explorer result groups
+_GROUPS = itemgetter('Groups')
+_KEYS = itemgetter('Keys')
+
+# Cost analysis window and Cost Explorer date format
+_THIRTY_DAYS = timedelta(days=30)
+_DATE_FMT = '%Y-%m-%d'
 
 class CostOptimizationCLI:
     """CLI for AWS cost optimization."""
@@ -23,6 +27,13 @@ class CostOptimizationCLI:
     def __init__(self):
         """Initialize the CLI."""
         self.optimizer = CostOptimizer()
+        
+        # Map each command to its handler
+        self._handlers = {
+            "help": self._show_help,
+            "analyze": self.analyze_costs,
+            "optimize": self.get_recommendations
+        }
     
     def _display_welcome(self):
         """Display welcome message."""
@@ -35,18 +46,25 @@ This tool helps you analyze and optimize your AWS costs. Available commands:
 - [green]exit[/green]: Exit the application
 """)
     
+    async def _show_help(self):
+        """Show the available commands."""
+        self._display_welcome()
+    
     def _display_costs(self, cost_data: Dict[str, Any]):
         """Display cost analysis in a table."""
+        from rich.table import Table
         table = Table(title="AWS Costs by Service")
         table.add_column("Service", style="cyan")
         table.add_column("Usage Type", style="magenta")
         table.add_column("Cost (USD)", style="green", justify="right")
         
-        for time_period in cost_data['costs']:
-            for group in time_period['Groups']:
-                service, usage_type = group['Keys']
-                cost = float(group['Metrics']['UnblendedCost']['Amount'])
-                table.add_row(service, usage_type, f"${cost:,.2f}")
+        rows = (
+            (*_KEYS(group), f"${float(group['Metrics']['UnblendedCost']['Amount']):,.2f}")
+            for time_period in cost_data['costs']
+            for group in _GROUPS(time_period)
+        )
+        for row in rows:
+            table.add_row(*row)
         
         console.print(table)
         console.print(f"\n[bold green]Total Cost: ${cost_data['total']:,.2f}[/bold green]")
@@ -56,11 +74,11 @@ This tool helps you analyze and optimize your AWS costs. Available commands:
         try:
             # Get costs for the last 30 days
             end_date = datetime.now()
-            start_date = end_date - timedelta(days=30)
+            start_date = end_date - _THIRTY_DAYS
             
             time_period = {
-                'Start': start_date.strftime('%Y-%m-%d'),
-                'End': end_date.strftime('%Y-%m-%d')
+                'Start': start_date.strftime(_DATE_FMT),
+                'End': end_date.strftime(_DATE_FMT)
             }
             
             console.print("\n[yellow]Analyzing costs for the last 30 days...[/yellow]")
@@ -72,6 +90,7 @@ This tool helps you analyze and optimize your AWS costs. Available commands:
     
     async def get_recommendations(self):
         """Get and display optimization recommendations."""
+        from rich.prompt import Confirm
         try:
             console.print("\n[yellow]Analyzing your AWS resources for optimization opportunities...[/yellow]")
             recommendations = await self.optimizer.get_optimization_recommendations()
@@ -91,18 +110,16 @@ This tool helps you analyze and optimize your AWS costs. Available commands:
         
         while True:
             try:
-                command = console.input("\n[bold green]>>> [/bold green]").lower().strip()
+                command = (await read_input("\n[bold green]>>> [/bold green]")).lower().strip()
                 
                 if command == "exit":
                     break
-                elif command == "help":
-                    self._display_welcome()
-                elif command == "analyze":
-                    await self.analyze_costs()
-                elif command == "optimize":
-                    await self.get_recommendations()
-                else:
+                
+                handler = self._handlers.get(command)
+                if handler is None:
                     console.print("[yellow]Unknown command. Type 'help' for available commands.[/yellow]")
+                else:
+                    await handler()
                     
             except KeyboardInterrupt:
                 console.print("\n[yellow]Use 'exit' to quit[/yellow]")
@@ -116,7 +133,7 @@ def main():
     """Main entry point for the CLI."""
     try:
         cli = CostOptimizationCLI()
-        asyncio.run(cli.run())
+        run(cli.run())
     except Exception as e:
         console.print(f"[red]Fatal error:[/red] {str(e)}")
         sys.exit(1)
@@ -5,14 +5,66 @@ CLI Interface module for handling user interactions.
 import re
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional
-import boto3
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, Optional
 
 from .command import Command, CommandType
-from ..config import DEFAULT_AWS_CONFIG
+from ..config import DEFAULT_AWS_CONFIG, configured_region
 
 logger = logging.getLogger(__name__)
 
+# Built-in command tokens
+_HELP_TOKENS = frozenset({"help", "?"})
+_EXIT_TOKENS = frozenset({"exit", "quit"})
+
+# All AWS command patterns combined into one alternation, one named group per command
+_COMMAND_PATTERN = re.compile(
+    r"(?P<list_instances>list\s+ec2\s+instances)"
+    r"|(?P<terminate_instance>terminate\s+ec2\s+instance\s+(?P<instance_id>i-[a-z0-9]+))"
+    r"|(?P<create_bucket>create\s+s3\s+bucket\s+(?P<bucket_name>[a-z0-9-]+))"
+    r"|(?P<list_buckets>list\s+s3\s+buckets)",
+    re.IGNORECASE
+)
+
+# Builders for the command configuration of each matched pattern
+_COMMAND_CONFIGS: Dict[str, Callable[[re.Match], Dict[str, Any]]] = {
+    "list_instances": lambda match: {
+        "service": "ec2",
+        "action": "list-instances",
+        "parameters": {}
+    },
+    "terminate_instance": lambda match: {
+        "service": "ec2",
+        "action": "terminate-instances",
+        "parameters": {"InstanceIds": [match["instance_id"]]}
+    },
+    "create_bucket": lambda match: {
+        "service": "s3",
+        "action": "create-bucket",
+        "parameters": {"Bucket": match["bucket_name"]}
+    },
+    "list_buckets": lambda match: {
+        "service": "s3",
+        "action": "list-buckets",
+        "parameters": {}
+    },
+}
+
+# Translation table for converting kebab-case actions to snake_case
+_KEBAB = str.maketrans("-", "_")
+
+@lru_cache(maxsize=None)
+def _client(service: str, region: Optional[str]):
+    """Create a boto3 client once per (service, region) pair; None uses boto3's lookup."""
+    import boto3
+    return boto3.client(service, region_name=region)
+
+@lru_cache(maxsize=None)
+def _client_method(service: str, region: Optional[str], action: str) -> Callable[..., Any]:
+    """Resolve the boto3 client method for a kebab-case action once."""
+    # Convert action from kebab-case to snake_case for boto3
+    return getattr(_client(service, region), action.translate(_KEBAB))
+
 class CLIInterface:
     """Main class for CLI interaction."""
     
@@ -20,18 +72,10 @@ class CLIInterface:
         """Initialize the CLI interface."""
         self.command_history: List[Command] = []
         self.aws_config = DEFAULT_AWS_CONFIG
-        self._command_patterns = self._compile_command_patterns()
+        # Only an explicitly configured region overrides boto3's own lookup
+        self.region = configured_region()
     
-    def _compile_command_patterns(self) -> Dict[str, re.Pattern]:
-        """Compile regex patterns for command parsing."""
-        return {
-            "list_instances": re.compile(r"list\s+ec2\s+instances"),
-            "terminate_instance": re.compile(r"terminate\s+ec2\s+instance\s+(i-[a-z0-9]+)"),
-            "create_bucket": re.compile(r"create\s+s3\s+bucket\s+([a-z0-9-]+)"),
-            "list_buckets": re.compile(r"list\s+s3\s+buckets"),
-        }
-    
-    async def process_input(self, user_input: str) -> Command:
+    def process_input(self, user_input: str) -> Command:
         """
         Process user input and convert it to a Command object.
         
@@ -44,64 +88,31 @@ class CLIInterface:
         user_input = user_input.strip().lower()
         
         # Check for built-in commands
-        if user_input in ["help", "?"]:
+        if user_input in _HELP_TOKENS:
             return Command(
                 type=CommandType.HELP,
                 service="cli",
                 action="help",
-                parameters={},
-                requires_approval=False
+                parameters={}
             )
-        elif user_input in ["exit", "quit"]:
+        elif user_input in _EXIT_TOKENS:
             return Command(
                 type=CommandType.EXIT,
                 service="cli",
                 action="exit",
-                parameters={},
-                requires_approval=False
+                parameters={}
             )
         
         # Try to match AWS commands
-        for pattern_name, pattern in self._command_patterns.items():
-            if match := pattern.match(user_input):
-                command_config = self._get_command_config(pattern_name, match)
-                return Command(
-                    type=CommandType.AWS,
-                    **command_config
-                )
+        if match := _COMMAND_PATTERN.match(user_input):
+            return Command(
+                type=CommandType.AWS,
+                **_COMMAND_CONFIGS[match.lastgroup](match)
+            )
         
         raise ValueError(f"Unknown command: {user_input}")
     
-    def _get_command_config(self, pattern_name: str, match: re.Match) -> Dict[str, Any]:
-        """Get command configuration based on the matched pattern."""
-        if pattern_name == "list_instances":
-            return {
-                "service": "ec2",
-                "action": "list-instances",
-                "parameters": {}
-            }
-        elif pattern_name == "terminate_instance":
-            return {
-                "service": "ec2",
-                "action": "terminate-instances",
-                "parameters": {"InstanceIds": [match.group(1)]}
-            }
-        elif pattern_name == "create_bucket":
-            return {
-                "service": "s3",
-                "action": "create-bucket",
-                "parameters": {"Bucket": match.group(1)}
-            }
-        elif pattern_name == "list_buckets":
-            return {
-                "service": "s3",
-                "action": "list-buckets",
-                "parameters": {}
-            }
-        else:
-            raise ValueError(f"Unknown pattern: {pattern_name}")
-    
-    async def approve_command(self, command: Command) -> None:
+    def approve_command(self, command: Command) -> None:
         """
         Approve a command for execution.
         
@@ -138,15 +149,17 @@ class CLIInterface:
     
     async def _execute_aws_command(self, command: Command) -> Dict[str, Any]:
         """Execute an AWS command using boto3."""
-        aws_command = command.to_aws_command()
-        client = boto3.client(aws_command["service"])
-        
-        # Convert action from kebab-case to snake_case for boto3
-        action = aws_command["action"].replace("-", "_")
+        if command.type != CommandType.AWS:
+            raise ValueError("Can only execute AWS commands")
         
         try:
-            method = getattr(client, action)
-            return method(**aws_command["parameters"])
+            method = _client_method(
+                command.service,
+                self.region,
+                command.action
+            )
+            # Run the blocking boto3 call in a worker thread so the event loop stays free
+            return await asyncio.to_thread(method, **command.parameters)
         except Exception as e:
             logger.error(f"Error executing AWS command: {e}")
             raise
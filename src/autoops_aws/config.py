@@ -4,7 +4,12 @@ Configuration Module
 This module contains default configuration settings for the AutoOps AWS agent.
 """
 
-from typing import Dict, Any
+import logging
+import os
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from pathlib import Path
 
 # Base Paths
@@ -13,8 +18,40 @@ CONFIG_DIR = BASE_DIR / "config"
 MODELS_DIR = BASE_DIR / "models"
 CACHE_DIR = BASE_DIR / "cache"
 
+@lru_cache(maxsize=1)
+def get_env() -> Mapping[str, str]:
+    """
+    Load the .env file and take a read-only snapshot of the environment.
+    
+    The file is only read on the first call, not when this module is imported.
+    
+    Returns:
+        Immutable mapping of environment variables
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    return MappingProxyType(dict(os.environ))
+
+def __getattr__(name: str) -> Any:
+    """Resolve the module-level ``ENV`` snapshot lazily."""
+    if name == "ENV":
+        return get_env()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def configured_region() -> Optional[str]:
+    """
+    Return the AWS region set explicitly in the environment.
+    
+    Returns:
+        Region name, or None to let boto3 resolve it (e.g. from the profile)
+    """
+    env = get_env()
+    return env.get("AWS_REGION") or env.get("AWS_DEFAULT_REGION")
+
 # AWS Configuration
 DEFAULT_AWS_CONFIG = {
+    # Fallback only; load_config() prefers a region set in the environment
     "region": "us-west-2",
     "max_retries": 3,
     "timeout": 300,
@@ -43,30 +80,28 @@ ML_CONFIG = {
 }
 
 # Logging Configuration
-LOGGING_CONFIG = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "formatters": {
-        "standard": {
-            "format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-        },
-    },
-    "handlers": {
-        "default": {
-            "level": "INFO",
-            "formatter": "standard",
-            "class": "logging.StreamHandler",
-            "stream": "ext://sys.stdout",
-        },
-    },
-    "loggers": {
-        "": {
-            "handlers": ["default"],
-            "level": "INFO",
-            "propagate": True
-        },
-    },
-}
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+LOG_LEVEL = logging.INFO
+
+_logging_configured = False
+
+def setup_logging() -> None:
+    """
+    Attach a stdout handler to the root logger.
+    
+    Safe to call more than once; only the first call has an effect.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(LOG_LEVEL)
+    _logging_configured = True
 
 def load_config(config_path: Path = None) -> Dict[str, Any]:
     """
@@ -83,8 +118,8 @@ def load_config(config_path: Path = None) -> Dict[str, Any]:
         pass
     
     return {
-        "aws": DEFAULT_AWS_CONFIG,
+        "aws": {**DEFAULT_AWS_CONFIG, "region": configured_region() or DEFAULT_AWS_CONFIG["region"]},
         "security": SECURITY_CONFIG,
         "ml": ML_CONFIG,
-        "logging": LOGGING_CONFIG,
+        "logging": {"format": LOG_FORMAT, "level": LOG_LEVEL},
     } 
\ No newline at end of file
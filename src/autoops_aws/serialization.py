@@ -0,0 +1,87 @@
+"""
+Serialization Module
+
+This module provides JSON encoding and decoding for agent responses and audit
+results. orjson is used when it is installed; otherwise the standard library is used.
+"""
+
+import dataclasses
+from datetime import date, time
+from enum import Enum
+from typing import Any, Callable, Optional, Union
+
+_dumps: Optional[Callable[[Any], bytes]] = None
+_loads: Optional[Callable[[Union[bytes, str]], Any]] = None
+
+def _json_default(obj: Any) -> Any:
+    """Convert the types orjson encodes natively the same way orjson does."""
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        # orjson reads the instance __dict__ (the fields for slotted classes)
+        # and leaves out names starting with an underscore
+        if hasattr(obj, "__dict__"):
+            names = list(vars(obj))
+        else:
+            names = [f.name for f in dataclasses.fields(obj)]
+        return {name: getattr(obj, name) for name in names if not name.startswith("_")}
+    return str(obj)
+
+def _load_dumps() -> Callable[[Any], bytes]:
+    """Pick the fastest available JSON encoder."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        # Compact, non-ASCII-escaped output so both encoders produce the same bytes
+        def dumps(obj: Any) -> bytes:
+            return json.dumps(
+                obj, default=_json_default, ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+    else:
+        def dumps(obj: Any) -> bytes:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    return dumps
+
+def _load_loads() -> Callable[[Union[bytes, str]], Any]:
+    """Pick the fastest available JSON decoder."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.loads
+    return orjson.loads
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize; unsupported types are converted with str()
+
+    Returns:
+        JSON document as bytes
+    """
+    global _dumps
+    if _dumps is None:
+        _dumps = _load_dumps()
+    return _dumps(obj)
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize a JSON document.
+    
+    Args:
+        data: JSON document as bytes or str
+        
+    Returns:
+        Decoded Python object
+    """
+    global _loads
+    if _loads is None:
+        _loads = _load_loads()
+    return _loads(data)
@@ -4,47 +4,384 @@ AWS Auditor Tool.
 This tool performs security and compliance checks on AWS resources.
 """
 
+import asyncio
+import copy
+import csv
+import io
 import logging
-from typing import Dict, Any, List
-import boto3
+import time
+from functools import cached_property, lru_cache
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
+import jmespath
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from ..serialization import dumps
+
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+
 logger = logging.getLogger(__name__)
 
+# Seconds for which a completed audit is reused
+AUDIT_CACHE_TTL = 300
+
+# How often and how many times to check whether the IAM credential report is ready
+CREDENTIAL_REPORT_POLL_INTERVAL = 2
+CREDENTIAL_REPORT_MAX_POLLS = 15
+
+# Maximum number of in-flight per-resource API calls for each audit section
+MAX_CONCURRENT_CALLS = 20
+
+# Shared client settings: room for concurrent calls, throttling-aware retries
+# and keepalive so connections survive between audit phases
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True
+)
+
+# User name of the root account row in the IAM credential report
+_ROOT_ACCOUNT = '<root_account>'
+
+# CIDR blocks that open a security group rule to the whole internet
+_WORLD_IPV4 = '0.0.0.0/0'
+_WORLD_IPV6 = '::/0'
+
+# Resource IDs of the evaluations on a get_compliance_details_by_config_rule page
+_NON_COMPLIANT_RESOURCE_IDS = (
+    "EvaluationResults[].EvaluationResultIdentifier.EvaluationResultQualifier.ResourceId"
+)
+
+def _collect(client: Any, operation: str, expression: str, **kwargs) -> List[Any]:
+    """
+    Page through a list/describe call and collect the items it returns.
+    
+    Args:
+        client: boto3 client
+        operation: Name of the paginated operation
+        expression: JMESPath expression selecting the items on each page
+        **kwargs: Parameters for the operation
+        
+    Returns:
+        Items from all pages
+    """
+    # Older botocore releases have no paginator for some calls (e.g. list_buckets)
+    if not client.can_paginate(operation):
+        response = getattr(client, operation)(**kwargs)
+        return jmespath.search(expression, response) or []
+    
+    paginator = client.get_paginator(operation)
+    return list(paginator.paginate(**kwargs).search(expression))
+
+async def _limited(semaphore: asyncio.Semaphore, func: Any, *args, **kwargs) -> Any:
+    """
+    Run a blocking client call on a thread once the semaphore has room.
+    
+    Args:
+        semaphore: Limits the number of calls in flight
+        func: Blocking function to call
+        *args, **kwargs: Arguments for the function
+        
+    Returns:
+        The function's result
+    """
+    async with semaphore:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+def _full_result(client: Any, operation: str, **kwargs) -> Dict[str, Any]:
+    """
+    Page through a call and merge all pages into a single response.
+    
+    Args:
+        client: boto3 client
+        operation: Name of the paginated operation
+        **kwargs: Parameters for the operation
+        
+    Returns:
+        Response with the lists from every page concatenated
+    """
+    paginator = client.get_paginator(operation)
+    return paginator.paginate(**kwargs).build_full_result()
+
+def _count_active_access_keys(report: bytes) -> Dict[str, int]:
+    """
+    Count the active access keys of each user in an IAM credential report.
+    
+    Args:
+        report: Credential report as CSV bytes
+        
+    Returns:
+        Dict mapping every user in the report (except the root account)
+        to their number of active access keys, including zero
+    """
+    rows = csv.reader(io.StringIO(report.decode('utf-8')))
+    
+    # Look up the column positions once instead of building a dict per row
+    header = next(rows, None)
+    if header is None:
+        return {}
+    columns = itemgetter(
+        header.index('user'),
+        header.index('access_key_1_active'),
+        header.index('access_key_2_active')
+    )
+    
+    counts = {}
+    for user, key_1_active, key_2_active in map(columns, rows):
+        if user != _ROOT_ACCOUNT:
+            counts[user] = (key_1_active == 'true') + (key_2_active == 'true')
+    return counts
+
+def _is_trust_overly_permissive(document: Dict[str, Any]) -> bool:
+    """
+    Check whether a role trust policy lets any principal assume the role.
+    
+    Args:
+        document: Parsed AssumeRolePolicyDocument
+        
+    Returns:
+        True if an Allow statement has a wildcard principal
+    """
+    statements = document.get('Statement', [])
+    if isinstance(statements, dict):
+        statements = [statements]
+    
+    for statement in statements:
+        if statement.get('Effect') != 'Allow':
+            continue
+        
+        principal = statement.get('Principal')
+        if principal == '*':
+            return True
+        if isinstance(principal, dict):
+            for value in principal.values():
+                if value == '*' or (isinstance(value, list) and '*' in value):
+                    return True
+    
+    return False
+
+def _bucket_policy_is_public(s3: Any, bucket: str) -> bool:
+    """Ask S3 whether a bucket's policy makes it public."""
+    try:
+        status = s3.get_bucket_policy_status(Bucket=bucket)
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'NoSuchBucketPolicy':
+            return False
+        raise
+    return status['PolicyStatus']['IsPublic']
+
+def _public_access_blocked(client: Any, **kwargs) -> bool:
+    """
+    Check whether all four public access block settings are on.
+    
+    Args:
+        client: S3 client (with Bucket=...) or S3 Control client (with AccountId=...)
+        **kwargs: Parameters for get_public_access_block
+        
+    Returns:
+        True if the bucket or account fully blocks public access
+    """
+    try:
+        response = client.get_public_access_block(**kwargs)
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'NoSuchPublicAccessBlockConfiguration':
+            return False
+        raise
+    return all(response['PublicAccessBlockConfiguration'].values())
+
+def _bucket_is_encrypted(s3: Any, bucket: str) -> bool:
+    """Check whether a bucket has default encryption configured."""
+    try:
+        s3.get_bucket_encryption(Bucket=bucket)
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ServerSideEncryptionConfigurationNotFoundError':
+            return False
+        raise
+    return True
+
+@lru_cache(maxsize=32)
+def _build_recommendations(
+    iam_issues: bool,
+    security_group_issues: bool,
+    s3_issues: bool,
+    non_compliant: int
+) -> Tuple[Dict[str, Any], ...]:
+    """
+    Build the recommendations for a summary of audit findings.
+    
+    Args:
+        iam_issues: Whether any IAM users have issues
+        security_group_issues: Whether any security groups have issues
+        s3_issues: Whether any S3 buckets have issues
+        non_compliant: Number of non-compliant resources
+        
+    Returns:
+        Tuple of recommendations
+    """
+    recommendations = []
+    
+    # IAM recommendations
+    if iam_issues:
+        recommendations.append({
+            "category": "Security",
+            "service": "IAM",
+            "priority": "High",
+            "description": "Review IAM user permissions and access keys",
+            "details": "Found users with direct policy attachments or active access keys"
+        })
+    
+    # Security group recommendations
+    if security_group_issues:
+        recommendations.append({
+            "category": "Security",
+            "service": "EC2",
+            "priority": "High",
+            "description": "Review security group rules",
+            "details": "Found security groups with overly permissive rules"
+        })
+    
+    # S3 recommendations
+    if s3_issues:
+        recommendations.append({
+            "category": "Security",
+            "service": "S3",
+            "priority": "High",
+            "description": "Review S3 bucket security",
+            "details": "Found buckets with public access or missing encryption"
+        })
+    
+    # Compliance recommendations
+    if non_compliant:
+        recommendations.append({
+            "category": "Compliance",
+            "service": "AWS Config",
+            "priority": "Medium",
+            "description": "Address non-compliant resources",
+            "details": f"Found {non_compliant} non-compliant resources"
+        })
+    
+    return tuple(recommendations)
+
+def _empty_section(section: str) -> Any:
+    """Return the result of an audit section that found nothing."""
+    if section == "iam":
+        return {"users": [], "roles": [], "policies": []}
+    if section == "compliance":
+        return {"compliant": [], "non_compliant": []}
+    return []
+
 class AWSAuditor:
     """Tool for auditing AWS resources."""
     
     def __init__(self):
         """Initialize the AWS auditor."""
-        self.iam = boto3.client('iam')
-        self.ec2 = boto3.client('ec2')
-        self.s3 = boto3.client('s3')
-        self.config = boto3.client('config')
-        
+        # Completed audits keyed by (account, region), with their completion time
+        self._cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+    
+    # boto3 clients block, so the audit methods call them via asyncio.to_thread
+    @cached_property
+    def iam(self) -> "BaseClient":
+        """IAM client, created on first use."""
+        import boto3
+        return boto3.client('iam', config=_CLIENT_CONFIG)
+    
+    @cached_property
+    def ec2(self) -> "BaseClient":
+        """EC2 client, created on first use."""
+        import boto3
+        return boto3.client('ec2', config=_CLIENT_CONFIG)
+    
+    @cached_property
+    def s3(self) -> "BaseClient":
+        """S3 client, created on first use."""
+        import boto3
+        return boto3.client('s3', config=_CLIENT_CONFIG)
+    
+    @cached_property
+    def s3control(self) -> "BaseClient":
+        """S3 Control client, created on first use."""
+        import boto3
+        return boto3.client('s3control', config=_CLIENT_CONFIG)
+    
+    @cached_property
+    def config(self) -> "BaseClient":
+        """AWS Config client, created on first use."""
+        import boto3
+        return boto3.client('config', config=_CLIENT_CONFIG)
+    
+    @cached_property
+    def sts(self) -> "BaseClient":
+        """STS client, created on first use."""
+        import boto3
+        return boto3.client('sts', config=_CLIENT_CONFIG)
+    
+    def clear_cache(self) -> None:
+        """Forget all cached audit results."""
+        self._cache.clear()
+    
     async def run_audit(self) -> Dict[str, Any]:
         """
         Run a comprehensive audit of AWS resources.
         
+        Results are reused for AUDIT_CACHE_TTL seconds per account and region.
+        
         Returns:
-            Dict containing audit results and recommendations
+            Dict containing audit results, recommendations and the errors
+            of any sections that could not be audited
         """
+        results: Dict[str, Any] = {"errors": []}
+        
+        # Without the account the cache cannot be keyed, but the audit still runs
+        account_id, cache_key = None, None
         try:
-            results = {
-                "iam": await self._audit_iam(),
-                "security_groups": await self._audit_security_groups(),
-                "s3": await self._audit_s3(),
-                "compliance": await self._check_compliance(),
-                "recommendations": []
-            }
-            
-            # Generate recommendations based on findings
-            results["recommendations"] = self._generate_recommendations(results)
-            
-            return results
-            
+            identity = await asyncio.to_thread(self.sts.get_caller_identity)
+            account_id = identity['Account']
+            cache_key = (account_id, self.ec2.meta.region_name)
         except Exception as e:
-            logger.error(f"Error during audit: {e}")
-            raise
+            logger.error(f"Error getting caller identity: {e}")
+            results["errors"].append({"section": "identity", "error": str(e)})
+        
+        # Callers get their own copy so changes to it never reach the cache
+        cached = self._cache.get(cache_key) if cache_key is not None else None
+        if cached is not None and time.monotonic() - cached[0] < AUDIT_CACHE_TTL:
+            return copy.deepcopy(cached[1])
+        
+        sections = ("iam", "security_groups", "s3", "compliance")
+        
+        # The sections query independent services, so run them concurrently
+        outcomes = await asyncio.gather(
+            self._audit_iam(),
+            self._audit_security_groups(),
+            self._audit_s3(account_id),
+            self._check_compliance(),
+            return_exceptions=True
+        )
+        
+        for section, outcome in zip(sections, outcomes):
+            if isinstance(outcome, Exception):
+                # A failing section is reported without aborting the others
+                logger.error(f"Error during audit of {section}: {outcome}")
+                results[section] = _empty_section(section)
+                results["errors"].append({"section": section, "error": str(outcome)})
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results[section] = outcome
+        
+        # Generate recommendations based on findings
+        results["recommendations"] = self._generate_recommendations(results)
+        
+        # Partial audits are not cached so failed sections are retried
+        if not results["errors"]:
+            self._cache[cache_key] = (time.monotonic(), copy.deepcopy(results))
+        
+        return results
+    
+    async def run_audit_bytes(self) -> bytes:
+        """Run an audit and encode the results as JSON for transport."""
+        return dumps(await self.run_audit())
     
     async def _audit_iam(self) -> Dict[str, Any]:
         """Audit IAM configurations."""
@@ -55,43 +392,48 @@ class AWSAuditor:
                 "policies": []
             }
             
+            # Two account-wide downloads replace the per-user and per-role calls
+            details, report = await asyncio.gather(
+                asyncio.to_thread(
+                    _full_result, self.iam, 'get_account_authorization_details',
+                    Filter=['User', 'Role']
+                ),
+                self._get_credential_report()
+            )
+            users = details.get('UserDetailList', [])
+            active_keys = _count_active_access_keys(report)
+            
+            # Users created after the report was generated are not in it, so
+            # look up their keys directly
+            missing = [user['UserName'] for user in users if user['UserName'] not in active_keys]
+            if missing:
+                semaphore = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+                counts = await asyncio.gather(
+                    *(self._count_user_access_keys(name, semaphore) for name in missing)
+                )
+                active_keys.update(zip(missing, counts))
+            
             # Check IAM users
-            users = self.iam.list_users()['Users']
             for user in users:
-                user_findings = {
-                    "username": user['UserName'],
-                    "issues": []
-                }
-                
                 # Check for access keys
-                access_keys = self.iam.list_access_keys(UserName=user['UserName'])['AccessKeyMetadata']
-                if len(access_keys) > 0:
-                    for key in access_keys:
-                        if key['Status'] == 'Active':
-                            user_findings["issues"].append("Has active access keys")
+                issues = ["Has active access keys"] * active_keys[user['UserName']]
                 
                 # Check for direct policy attachments
-                attached_policies = self.iam.list_attached_user_policies(UserName=user['UserName'])
-                if attached_policies['AttachedPolicies']:
-                    user_findings["issues"].append("Has directly attached policies")
+                if user.get('AttachedManagedPolicies'):
+                    issues.append("Has directly attached policies")
                 
-                if user_findings["issues"]:
-                    findings["users"].append(user_findings)
+                # Only users with issues get a findings entry
+                if issues:
+                    findings["users"].append({"username": user['UserName'], "issues": issues})
             
             # Check roles
-            roles = self.iam.list_roles()['Roles']
-            for role in roles:
-                role_findings = {
-                    "rolename": role['RoleName'],
-                    "issues": []
-                }
-                
+            for role in details.get('RoleDetailList', []):
                 # Check for overly permissive trust relationships
-                if '*' in str(role['AssumeRolePolicyDocument']):
-                    role_findings["issues"].append("Overly permissive trust relationship")
-                
-                if role_findings["issues"]:
-                    findings["roles"].append(role_findings)
+                if _is_trust_overly_permissive(role['AssumeRolePolicyDocument']):
+                    findings["roles"].append({
+                        "rolename": role['RoleName'],
+                        "issues": ["Overly permissive trust relationship"]
+                    })
             
             return findings
             
@@ -99,26 +441,80 @@ class AWSAuditor:
             logger.error(f"Error auditing IAM: {e}")
             raise
     
-    async def _audit_security_groups(self) -> Dict[str, Any]:
+    async def _get_credential_report(self) -> bytes:
+        """
+        Generate the IAM credential report and download it.
+        
+        IAM reuses a report generated in the last four hours, so access key
+        status can be up to four hours old; users created since then are
+        missing from it and are checked with list_access_keys instead.
+        
+        Returns:
+            Credential report as CSV bytes
+        """
+        for _ in range(CREDENTIAL_REPORT_MAX_POLLS):
+            response = await asyncio.to_thread(self.iam.generate_credential_report)
+            if response['State'] == 'COMPLETE':
+                break
+            await asyncio.sleep(CREDENTIAL_REPORT_POLL_INTERVAL)
+        else:
+            raise TimeoutError("IAM credential report was not generated in time")
+        
+        report = await asyncio.to_thread(self.iam.get_credential_report)
+        return report['Content']
+    
+    async def _count_user_access_keys(self, username: str, semaphore: asyncio.Semaphore) -> int:
+        """
+        Count a user's active access keys with a live IAM call.
+        
+        Args:
+            username: IAM user name
+            semaphore: Limits the number of concurrent IAM calls
+            
+        Returns:
+            Number of active access keys
+        """
+        keys = await _limited(
+            semaphore, _collect, self.iam, 'list_access_keys', 'AccessKeyMetadata[].Status',
+            UserName=username
+        )
+        return keys.count('Active')
+    
+    async def _audit_security_groups(self) -> List[Dict[str, Any]]:
         """Audit EC2 security groups."""
         try:
             findings = []
             
-            security_groups = self.ec2.describe_security_groups()['SecurityGroups']
+            # Let EC2 return only the groups with a world-open ingress rule
+            ipv4_groups, ipv6_groups = await asyncio.gather(
+                asyncio.to_thread(
+                    _collect, self.ec2, 'describe_security_groups', 'SecurityGroups',
+                    Filters=[{'Name': 'ip-permission.cidr', 'Values': [_WORLD_IPV4]}]
+                ),
+                asyncio.to_thread(
+                    _collect, self.ec2, 'describe_security_groups', 'SecurityGroups',
+                    Filters=[{'Name': 'ip-permission.ipv6-cidr', 'Values': [_WORLD_IPV6]}]
+                )
+            )
+            
+            # Groups open on both IPv4 and IPv6 are returned by both calls
+            security_groups = {sg['GroupId']: sg for sg in ipv4_groups + ipv6_groups}.values()
             for sg in security_groups:
-                sg_findings = {
-                    "group_id": sg['GroupId'],
-                    "group_name": sg['GroupName'],
-                    "issues": []
-                }
+                issues = []
                 
                 # Check for overly permissive rules
                 for rule in sg['IpPermissions']:
-                    if any(ip['CidrIp'] == '0.0.0.0/0' for ip in rule.get('IpRanges', [])):
-                        sg_findings["issues"].append(f"Open to world on port(s): {rule.get('FromPort', 'ALL')}")
+                    if (any(ip['CidrIp'] == _WORLD_IPV4 for ip in rule.get('IpRanges', []))
+                            or any(ip['CidrIpv6'] == _WORLD_IPV6 for ip in rule.get('Ipv6Ranges', []))):
+                        issues.append(f"Open to world on port(s): {rule.get('FromPort', 'ALL')}")
                 
-                if sg_findings["issues"]:
-                    findings.append(sg_findings)
+                # Only groups with issues get a findings entry
+                if issues:
+                    findings.append({
+                        "group_id": sg['GroupId'],
+                        "group_name": sg['GroupName'],
+                        "issues": issues
+                    })
             
             return findings
             
@@ -126,38 +522,37 @@ class AWSAuditor:
             logger.error(f"Error auditing security groups: {e}")
             raise
     
-    async def _audit_s3(self) -> Dict[str, Any]:
-        """Audit S3 buckets."""
+    async def _audit_s3(self, account_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Audit S3 buckets.
+        
+        Args:
+            account_id: Account being audited; looked up with STS if not given
+        """
         try:
             findings = []
             
-            buckets = self.s3.list_buckets()['Buckets']
-            for bucket in buckets:
-                bucket_findings = {
-                    "bucket_name": bucket['Name'],
-                    "issues": []
-                }
-                
-                try:
-                    # Check bucket policy
-                    policy = self.s3.get_bucket_policy(Bucket=bucket['Name'])
-                    if '*' in policy['Policy']:
-                        bucket_findings["issues"].append("Public bucket policy")
-                except ClientError as e:
-                    if e.response['Error']['Code'] != 'NoSuchBucketPolicy':
-                        raise
-                
-                # Check encryption
-                try:
-                    encryption = self.s3.get_bucket_encryption(Bucket=bucket['Name'])
-                except ClientError as e:
-                    if e.response['Error']['Code'] == 'ServerSideEncryptionConfigurationNotFoundError':
-                        bucket_findings["issues"].append("No default encryption")
-                    else:
-                        raise
-                
-                if bucket_findings["issues"]:
-                    findings.append(bucket_findings)
+            buckets = await asyncio.to_thread(_collect, self.s3, 'list_buckets', 'Buckets')
+            if account_id is None:
+                identity = await asyncio.to_thread(self.sts.get_caller_identity)
+                account_id = identity['Account']
+            
+            # An account-level public access block covers every bucket
+            try:
+                account_blocked = await asyncio.to_thread(
+                    _public_access_blocked, self.s3control, AccountId=account_id
+                )
+            except ClientError as e:
+                # Without s3:GetAccountPublicAccessBlock each bucket is checked instead
+                logger.error(f"Error getting account public access block: {e}")
+                account_blocked = False
+            
+            # Check buckets concurrently
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+            bucket_results = await asyncio.gather(
+                *(self._check_bucket(bucket, semaphore, account_blocked) for bucket in buckets)
+            )
+            findings.extend(result for result in bucket_results if result is not None)
             
             return findings
             
@@ -165,6 +560,50 @@ class AWSAuditor:
             logger.error(f"Error auditing S3: {e}")
             raise
     
+    async def _check_bucket(
+        self,
+        bucket: Dict[str, Any],
+        semaphore: asyncio.Semaphore,
+        account_blocked: bool
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Check a single S3 bucket.
+        
+        Args:
+            bucket: Bucket entry from list_buckets
+            semaphore: Limits the number of concurrent S3 calls
+            account_blocked: Whether the account-level public access block
+                already covers all buckets
+            
+        Returns:
+            Findings for the bucket, or None if it has no issues
+        """
+        checks = [
+            _limited(semaphore, _bucket_policy_is_public, self.s3, bucket['Name']),
+            _limited(semaphore, _bucket_is_encrypted, self.s3, bucket['Name'])
+        ]
+        if not account_blocked:
+            checks.append(
+                _limited(semaphore, _public_access_blocked, self.s3, Bucket=bucket['Name'])
+            )
+        
+        # The checks are independent, so run them in parallel; each call
+        # takes its own permit so the S3 calls in flight stay capped
+        policy_is_public, is_encrypted, *bucket_blocked = await asyncio.gather(*checks)
+        
+        issues = []
+        if policy_is_public:
+            issues.append("Public bucket policy")
+        if not account_blocked and not bucket_blocked[0]:
+            issues.append("Public access block not fully enabled")
+        if not is_encrypted:
+            issues.append("No default encryption")
+        
+        # Only buckets with issues get a findings entry
+        if issues:
+            return {"bucket_name": bucket['Name'], "issues": issues}
+        return None
+    
     async def _check_compliance(self) -> Dict[str, Any]:
         """Check AWS Config rules compliance."""
         try:
@@ -173,20 +612,34 @@ class AWSAuditor:
                 "non_compliant": []
             }
             
-            rules = self.config.describe_config_rules()['ConfigRules']
+            # Rule-level status; rules without evaluations (INSUFFICIENT_DATA,
+            # NOT_APPLICABLE) are reported as neither compliant nor non-compliant
+            rules = await asyncio.to_thread(
+                _collect, self.config, 'describe_compliance_by_config_rule',
+                'ComplianceByConfigRules'
+            )
             for rule in rules:
-                result = self.config.get_compliance_details_by_config_rule(
-                    ConfigRuleName=rule['ConfigRuleName']
-                )
+                compliance_type = rule['Compliance']['ComplianceType']
+                if compliance_type == 'COMPLIANT':
+                    compliance["compliant"].append(rule['ConfigRuleName'])
+                    continue
+                if compliance_type != 'NON_COMPLIANT':
+                    continue
                 
-                for evaluation in result['EvaluationResults']:
-                    if evaluation['ComplianceType'] == 'NON_COMPLIANT':
-                        compliance["non_compliant"].append({
-                            "rule": rule['ConfigRuleName'],
-                            "resource": evaluation['EvaluationResultIdentifier']['EvaluationResultQualifier']['ResourceId']
-                        })
-                    else:
-                        compliance["compliant"].append(rule['ConfigRuleName'])
+                # Only non-compliant evaluations are requested from the API
+                resources = await asyncio.to_thread(
+                    _collect,
+                    self.config,
+                    'get_compliance_details_by_config_rule',
+                    _NON_COMPLIANT_RESOURCE_IDS,
+                    ConfigRuleName=rule['ConfigRuleName'],
+                    ComplianceTypes=['NON_COMPLIANT']
+                )
+                for resource in resources:
+                    compliance["non_compliant"].append({
+                        "rule": rule['ConfigRuleName'],
+                        "resource": resource
+                    })
             
             return compliance
             
@@ -196,46 +649,12 @@ class AWSAuditor:
     
     def _generate_recommendations(self, audit_results: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate recommendations based on audit findings."""
-        recommendations = []
-        
-        # IAM recommendations
-        if audit_results["iam"]["users"]:
-            recommendations.append({
-                "category": "Security",
-                "service": "IAM",
-                "priority": "High",
-                "description": "Review IAM user permissions and access keys",
-                "details": "Found users with direct policy attachments or active access keys"
-            })
-        
-        # Security group recommendations
-        if audit_results["security_groups"]:
-            recommendations.append({
-                "category": "Security",
-                "service": "EC2",
-                "priority": "High",
-                "description": "Review security group rules",
-                "details": "Found security groups with overly permissive rules"
-            })
-        
-        # S3 recommendations
-        if audit_results["s3"]:
-            recommendations.append({
-                "category": "Security",
-                "service": "S3",
-                "priority": "High",
-                "description": "Review S3 bucket security",
-                "details": "Found buckets with public access or missing encryption"
-            })
-        
-        # Compliance recommendations
-        if audit_results["compliance"]["non_compliant"]:
-            recommendations.append({
-                "category": "Compliance",
-                "service": "AWS Config",
-                "priority": "Medium",
-                "description": "Address non-compliant resources",
-                "details": f"Found {len(audit_results['compliance']['non_compliant'])} non-compliant resources"
-            })
-        
-        return recommendations 
\ No newline at end of file
+        # Recommendations only depend on which sections found issues, so
+        # audits with equivalent findings share one cached result
+        recommendations = _build_recommendations(
+            bool(audit_results["iam"]["users"]),
+            bool(audit_results["security_groups"]),
+            bool(audit_results["s3"]),
+            len(audit_results["compliance"]["non_compliant"])
+        )
+        return [dict(rec) for rec in recommendations]
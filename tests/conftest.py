@@ -0,0 +1,21 @@
+"""
+Shared test configuration.
+"""
+
+import boto3
+import pytest
+from unittest.mock import Mock
+
+from autoops_aws.cli.interface import _client, _client_method
+
+@pytest.fixture(autouse=True)
+def mock_boto3_client(monkeypatch):
+    """Replace boto3.client so no test creates a real client or reaches AWS."""
+    monkeypatch.setattr(boto3, "client", lambda *args, **kwargs: Mock())
+    
+    # The CLI caches clients process-wide; start and end each test without them
+    _client.cache_clear()
+    _client_method.cache_clear()
+    yield
+    _client.cache_clear()
+    _client_method.cache_clear()
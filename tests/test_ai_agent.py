@@ -0,0 +1,47 @@
+"""
+Tests for the AI Agent response parsing.
+"""
+
+import importlib
+import sys
+import types
+
+import pytest
+
+RESPONSE = "I will {} your AWS account."
+
+@pytest.fixture
+def parse(monkeypatch):
+    """Return the agent's response parser without creating a Gemini client."""
+    # The agent imports tool modules that are not part of this package yet
+    for name, cls in (("cost_analyzer", "CostAnalyzer"), ("terraform_generator", "TerraformGenerator")):
+        module = types.ModuleType(f"autoops_aws.tools.{name}")
+        setattr(module, cls, object)
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+    monkeypatch.delitem(sys.modules, "autoops_aws.agent.ai_agent", raising=False)
+    
+    ai_agent = importlib.import_module("autoops_aws.agent.ai_agent")
+    agent = object.__new__(ai_agent.AWSAIAgent)
+    return agent._parse_ai_response
+
+@pytest.mark.parametrize("words, expected", [
+    ("audit and optimize the costs of", "audit"),
+    ("optimize the infrastructure costs of", "analyze_costs"),
+    ("analyze and optimize", "analyze_costs"),
+    ("write Terraform to optimize", "generate_terraform"),
+    ("OPTIMIZE", "optimize"),
+])
+def test_parse_ai_response_priority(parse, words, expected):
+    """Test that the highest priority keyword decides the action."""
+    action_type, _ = parse(RESPONSE.format(words))
+    assert action_type == expected
+
+def test_parse_ai_response_terraform_description(parse):
+    """Test that Terraform requests pass the response on as the description."""
+    response = RESPONSE.format("create infrastructure for")
+    assert parse(response) == ("generate_terraform", {"description": response})
+
+def test_parse_ai_response_unknown(parse):
+    """Test that a response without keywords is not mapped to an action."""
+    response = "Hello, how can I help?"
+    assert parse(response) == ("unknown", {"response": response})
@@ -0,0 +1,227 @@
+"""
+Tests for the AWS Auditor tool.
+"""
+
+import pytest
+from unittest.mock import Mock
+from botocore.exceptions import ClientError
+from autoops_aws.tools import aws_auditor
+from autoops_aws.tools.aws_auditor import AWSAuditor, _count_active_access_keys, _is_trust_overly_permissive
+
+ACCOUNT_ID = "123456789012"
+ROLE_ARN = "arn:aws:iam::123456789012:role/admin"
+
+# Trimmed IAM credential report; real reports carry more columns in between
+CREDENTIAL_REPORT = (
+    b"user,arn,password_enabled,access_key_1_active,access_key_1_last_rotated,access_key_2_active\n"
+    b"<root_account>,arn:aws:iam::123456789012:root,not_supported,true,N/A,true\n"
+    b"alice,arn:aws:iam::123456789012:user/alice,true,true,N/A,true\n"
+    b"bob,arn:aws:iam::123456789012:user/bob,false,true,N/A,false\n"
+    b"carol,arn:aws:iam::123456789012:user/carol,true,false,N/A,false\n"
+)
+
+def client_error(code):
+    """Build a ClientError with the given error code."""
+    return ClientError({"Error": {"Code": code, "Message": code}}, "Operation")
+
+def paginates(client, items):
+    """Make every paginated call on a mock client return the given items."""
+    client.can_paginate.return_value = True
+    client.get_paginator.return_value.paginate.return_value.search.return_value = items
+
+FULL_BLOCK = {
+    "BlockPublicAcls": True,
+    "IgnorePublicAcls": True,
+    "BlockPublicPolicy": True,
+    "RestrictPublicBuckets": True
+}
+
+# Bucket name -> (policy status, public access block, encryption); None means
+# the bucket has no such configuration
+BUCKETS = {
+    "public-policy": (True, FULL_BLOCK, True),
+    "no-policy": (None, None, True),
+    "partial-block": (False, {**FULL_BLOCK, "RestrictPublicBuckets": False}, None),
+    "clean": (None, FULL_BLOCK, True),
+}
+
+def stub_buckets(s3):
+    """Serve the BUCKETS configurations from a mock S3 client."""
+    paginates(s3, [{"Name": name} for name in BUCKETS])
+    
+    def policy_status(Bucket):
+        is_public = BUCKETS[Bucket][0]
+        if is_public is None:
+            raise client_error("NoSuchBucketPolicy")
+        return {"PolicyStatus": {"IsPublic": is_public}}
+    
+    def public_access_block(Bucket):
+        block = BUCKETS[Bucket][1]
+        if block is None:
+            raise client_error("NoSuchPublicAccessBlockConfiguration")
+        return {"PublicAccessBlockConfiguration": block}
+    
+    def encryption(Bucket):
+        if BUCKETS[Bucket][2] is None:
+            raise client_error("ServerSideEncryptionConfigurationNotFoundError")
+        return {"ServerSideEncryptionConfiguration": {"Rules": []}}
+    
+    s3.get_bucket_policy_status.side_effect = policy_status
+    s3.get_public_access_block.side_effect = public_access_block
+    s3.get_bucket_encryption.side_effect = encryption
+
+@pytest.fixture
+def auditor():
+    """Create an AWSAuditor whose clients describe an account without findings."""
+    auditor = AWSAuditor()
+    
+    # The clients are cached properties, so mocks placed in __dict__ are used instead
+    for name in ("iam", "ec2", "s3", "s3control", "config", "sts"):
+        client = Mock()
+        paginates(client, [])
+        auditor.__dict__[name] = client
+    
+    auditor.sts.get_caller_identity.return_value = {"Account": ACCOUNT_ID}
+    auditor.ec2.meta.region_name = "us-east-1"
+    auditor.iam.get_paginator.return_value.paginate.return_value.build_full_result.return_value = {
+        "UserDetailList": [], "RoleDetailList": []
+    }
+    auditor.iam.generate_credential_report.return_value = {"State": "COMPLETE"}
+    auditor.iam.get_credential_report.return_value = {"Content": CREDENTIAL_REPORT}
+    auditor.s3control.get_public_access_block.return_value = {
+        "PublicAccessBlockConfiguration": FULL_BLOCK
+    }
+    return auditor
+
+@pytest.mark.parametrize("statement", [
+    {"Effect": "Allow", "Principal": "*", "Action": "sts:AssumeRole"},
+    {"Effect": "Allow", "Principal": {"AWS": "*"}, "Action": "sts:AssumeRole"},
+    {"Effect": "Allow", "Principal": {"AWS": [ROLE_ARN, "*"]}, "Action": "sts:AssumeRole"},
+])
+def test_trust_policy_allowing_anyone_is_permissive(statement):
+    """Test that a wildcard principal in an Allow statement is flagged."""
+    assert _is_trust_overly_permissive({"Statement": [statement]})
+
+def test_trust_policy_single_statement_dict():
+    """Test that a Statement given as a single dict is checked."""
+    document = {"Statement": {"Effect": "Allow", "Principal": "*", "Action": "sts:AssumeRole"}}
+    assert _is_trust_overly_permissive(document)
+
+def test_trust_policy_wildcard_deny_is_not_permissive():
+    """Test that a wildcard principal in a Deny statement is not flagged."""
+    document = {"Statement": [{"Effect": "Deny", "Principal": "*", "Action": "sts:AssumeRole"}]}
+    assert not _is_trust_overly_permissive(document)
+
+def test_trust_policy_named_principals_are_not_permissive():
+    """Test that trust limited to named principals is not flagged."""
+    document = {"Statement": [{
+        "Effect": "Allow",
+        "Principal": {"AWS": [ROLE_ARN], "Service": "ec2.amazonaws.com"},
+        "Action": "sts:AssumeRole"
+    }]}
+    assert not _is_trust_overly_permissive(document)
+
+def test_count_active_access_keys():
+    """Test that active keys are counted per user and the root account is skipped."""
+    assert _count_active_access_keys(CREDENTIAL_REPORT) == {"alice": 2, "bob": 1, "carol": 0}
+
+def test_count_active_access_keys_empty_report():
+    """Test that an empty credential report yields no users."""
+    assert _count_active_access_keys(b"") == {}
+
+@pytest.mark.asyncio
+async def test_run_audit_reuses_results_within_ttl(auditor):
+    """Test that a repeated audit is served from the cache."""
+    first = await auditor.run_audit()
+    second = await auditor.run_audit()
+    
+    assert first == second
+    assert first["errors"] == []
+    assert auditor.iam.generate_credential_report.call_count == 1
+
+@pytest.mark.asyncio
+async def test_run_audit_reruns_after_ttl(auditor, monkeypatch):
+    """Test that an expired cache entry is audited again."""
+    monkeypatch.setattr(aws_auditor, "AUDIT_CACHE_TTL", 0)
+    
+    await auditor.run_audit()
+    await auditor.run_audit()
+    
+    assert auditor.iam.generate_credential_report.call_count == 2
+
+@pytest.mark.asyncio
+async def test_run_audit_cache_is_isolated_from_callers(auditor):
+    """Test that changing a result never changes later cached results."""
+    # The stored copy is independent of the result that was returned
+    first = await auditor.run_audit()
+    first["recommendations"].append({"changed": True})
+    first["iam"]["users"].append({"changed": True})
+    
+    # And every hit returns a fresh copy
+    second = await auditor.run_audit()
+    assert second["recommendations"] == [] and second["iam"]["users"] == []
+    second["s3"].append({"changed": True})
+    
+    third = await auditor.run_audit()
+    assert third["s3"] == []
+    assert third is not second
+
+@pytest.mark.asyncio
+async def test_run_audit_identity_failure(auditor):
+    """Test that an STS failure is reported and the sections still run."""
+    auditor.sts.get_caller_identity.side_effect = client_error("ExpiredToken")
+    
+    results = await auditor.run_audit()
+    
+    assert results["errors"][0]["section"] == "identity"
+    assert "ExpiredToken" in results["errors"][0]["error"]
+    assert auditor.iam.generate_credential_report.called
+    assert auditor._cache == {}
+
+@pytest.mark.asyncio
+async def test_run_audit_section_failure(auditor):
+    """Test that a failing section is reported empty without stopping the others."""
+    auditor.iam.generate_credential_report.side_effect = client_error("AccessDenied")
+    auditor.config.get_paginator.side_effect = client_error("NoSuchConfigurationRecorder")
+    
+    results = await auditor.run_audit()
+    
+    assert results["iam"] == {"users": [], "roles": [], "policies": []}
+    assert results["compliance"] == {"compliant": [], "non_compliant": []}
+    assert [error["section"] for error in results["errors"]] == ["iam", "compliance"]
+    assert results["security_groups"] == [] and results["s3"] == []
+    
+    # Partial results are not cached, so the next audit retries
+    await auditor.run_audit()
+    assert auditor.iam.generate_credential_report.call_count == 2
+
+@pytest.mark.parametrize("account_error", ["NoSuchPublicAccessBlockConfiguration", "AccessDenied"])
+@pytest.mark.asyncio
+async def test_audit_s3_checks_each_bucket(auditor, account_error):
+    """Test the bucket findings when the account does not block public access."""
+    stub_buckets(auditor.s3)
+    auditor.s3control.get_public_access_block.side_effect = client_error(account_error)
+    
+    findings = await auditor._audit_s3(ACCOUNT_ID)
+    
+    assert findings == [
+        {"bucket_name": "public-policy", "issues": ["Public bucket policy"]},
+        {"bucket_name": "no-policy", "issues": ["Public access block not fully enabled"]},
+        {"bucket_name": "partial-block", "issues": [
+            "Public access block not fully enabled", "No default encryption"
+        ]},
+    ]
+    auditor.s3control.get_public_access_block.assert_called_once_with(AccountId=ACCOUNT_ID)
+
+@pytest.mark.asyncio
+async def test_audit_s3_account_block_covers_buckets(auditor):
+    """Test that an account-level public access block skips the bucket-level check."""
+    stub_buckets(auditor.s3)
+    
+    findings = await auditor._audit_s3(ACCOUNT_ID)
+    
+    assert findings == [
+        {"bucket_name": "public-policy", "issues": ["Public bucket policy"]},
+        {"bucket_name": "partial-block", "issues": ["No default encryption"]},
+    ]
+    auditor.s3.get_public_access_block.assert_not_called()
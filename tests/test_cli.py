@@ -2,12 +2,19 @@
 Tests for the CLI interface module.
 """
 
+import os
+import signal
+import sys
+import threading
+
 import pytest
 from unittest.mock import Mock, patch
+from autoops_aws.cli import _console
+from autoops_aws.cli.app import CLIApp
 from autoops_aws.cli.interface import CLIInterface
 from autoops_aws.cli.command import Command, CommandType
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def cli_interface():
     """Create a CLIInterface instance for testing."""
     return CLIInterface()
@@ -18,11 +25,10 @@ def test_cli_interface_initialization(cli_interface):
     assert hasattr(cli_interface, "command_history")
     assert isinstance(cli_interface.command_history, list)
 
-@pytest.mark.asyncio
-async def test_process_user_input():
+def test_process_user_input():
     """Test processing of user input into a command."""
     cli = CLIInterface()
-    command = await cli.process_input("list ec2 instances")
+    command = cli.process_input("list ec2 instances")
     
     assert isinstance(command, Command)
     assert command.type == CommandType.AWS
@@ -30,11 +36,10 @@ async def test_process_user_input():
     assert command.action == "list-instances"
     assert not command.is_approved
 
-@pytest.mark.asyncio
-async def test_command_requires_approval():
+def test_command_requires_approval():
     """Test that AWS commands require approval before execution."""
     cli = CLIInterface()
-    command = await cli.process_input("terminate ec2 instance i-1234567890abcdef0")
+    command = cli.process_input("terminate ec2 instance i-1234567890abcdef0")
     
     assert not command.is_approved
     assert command.requires_approval
@@ -42,17 +47,16 @@ async def test_command_requires_approval():
     assert command.service == "ec2"
     assert command.action == "terminate-instances"
 
-@pytest.mark.asyncio
-async def test_command_approval_flow():
+def test_command_approval_flow():
     """Test the command approval flow."""
     cli = CLIInterface()
-    command = await cli.process_input("create s3 bucket my-test-bucket")
+    command = cli.process_input("create s3 bucket my-test-bucket")
     
     # Command should start unapproved
     assert not command.is_approved
     
     # Approve the command
-    await cli.approve_command(command)
+    cli.approve_command(command)
     assert command.is_approved
     
     # Should be in command history
@@ -62,19 +66,55 @@ async def test_command_approval_flow():
 async def test_safe_command_execution():
     """Test that only approved commands can be executed."""
     cli = CLIInterface()
-    command = await cli.process_input("list s3 buckets")
+    command = cli.process_input("list s3 buckets")
     
     # Try to execute without approval
     with pytest.raises(ValueError, match="Command must be approved before execution"):
         await cli.execute_command(command)
     
     # Approve and execute
-    await cli.approve_command(command)
-    with patch("autoops_aws.cli.interface.boto3") as mock_boto3:
+    cli.approve_command(command)
+    with patch("boto3.client") as mock_client:
         mock_s3 = Mock()
-        mock_boto3.client.return_value = mock_s3
+        mock_client.return_value = mock_s3
         mock_s3.list_buckets.return_value = {"Buckets": []}
         
         result = await cli.execute_command(command)
         assert result is not None
-        mock_s3.list_buckets.assert_called_once() 
\ No newline at end of file
+        mock_s3.list_buckets.assert_called_once()
+
+@pytest.mark.skipif(sys.platform == "win32", reason="SIGINT cannot be sent to the own process")
+def test_ctrl_c_at_prompt_keeps_running(monkeypatch):
+    """Test that Ctrl-C at the prompt prints a hint instead of leaving the app."""
+    reading = threading.Event()
+    hinted = threading.Event()
+    reads = []
+    messages = []
+    
+    def fake_input(prompt):
+        reads.append(prompt)
+        reading.set()
+        hinted.wait(timeout=5)
+        return "exit"
+    
+    def fake_print(*objects, **kwargs):
+        messages.append(" ".join(map(str, objects)))
+        if "Use 'exit' to quit" in messages[-1]:
+            hinted.set()
+    
+    def interrupt():
+        reading.wait(timeout=5)
+        os.kill(os.getpid(), signal.SIGINT)
+    
+    monkeypatch.setattr(_console.CONSOLE, "input", fake_input)
+    monkeypatch.setattr(_console.CONSOLE, "print", fake_print)
+    handler = signal.getsignal(signal.SIGINT)
+    threading.Thread(target=interrupt, daemon=True).start()
+    
+    _console.run(CLIApp().run())
+    
+    # The waiting reader is reused, so stdin is only read once
+    assert len(reads) == 1
+    assert any("Use 'exit' to quit" in message for message in messages)
+    assert "Goodbye!" in messages[-1]
+    assert signal.getsignal(signal.SIGINT) is handler
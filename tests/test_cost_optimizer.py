@@ -0,0 +1,116 @@
+"""
+Tests for the Cost Optimizer agent.
+"""
+
+import pytest
+from unittest.mock import Mock
+from botocore.exceptions import ClientError
+from autoops_aws.agent.cost_optimizer import CostOptimizer, MAX_METRIC_QUERIES
+
+# One more instance than fits in a single GetMetricData call
+INSTANCE_IDS = [f"i-{n:04d}" for n in range(MAX_METRIC_QUERIES + 1)]
+
+# Instance without CloudWatch datapoints
+IDLE_INSTANCE = "i-0003"
+
+def cpu_values(instance_id):
+    """Return distinct CPU datapoints per instance, none for IDLE_INSTANCE."""
+    if instance_id == IDLE_INSTANCE:
+        return []
+    n = int(instance_id[2:])
+    return [float(n), float(n + 2)]
+
+def metric_data_pages(MetricDataQueries, StartTime, EndTime):
+    """Answer GetMetricData queries with results in reverse order."""
+    results = [
+        {
+            "Id": query["Id"],
+            "Values": cpu_values(query["MetricStat"]["Metric"]["Dimensions"][0]["Value"])
+        }
+        for query in reversed(MetricDataQueries)
+    ]
+    return [{"MetricDataResults": results}]
+
+def pages(*items):
+    """Build a mock paginator returning one page per item."""
+    paginator = Mock()
+    paginator.paginate.return_value = list(items)
+    return paginator
+
+@pytest.fixture
+def optimizer():
+    """Create a CostOptimizer with mock clients."""
+    optimizer = CostOptimizer()
+    
+    # The clients are cached properties, so mocks placed in __dict__ are used instead
+    for name in ("cost_explorer", "ec2", "rds", "cloudwatch"):
+        optimizer.__dict__[name] = Mock()
+    
+    optimizer.cloudwatch.get_paginator.return_value.paginate.side_effect = metric_data_pages
+    return optimizer
+
+def test_average_cpu_joins_results_to_instances(optimizer):
+    """Test that results are matched to instances by query ID across batches."""
+    average_cpu = optimizer._get_average_cpu(INSTANCE_IDS)
+    
+    expected = {
+        instance_id: sum(cpu_values(instance_id)) / 2
+        for instance_id in INSTANCE_IDS
+        if instance_id != IDLE_INSTANCE
+    }
+    assert average_cpu == expected
+    
+    batches = [
+        call.kwargs["MetricDataQueries"]
+        for call in optimizer.cloudwatch.get_paginator.return_value.paginate.call_args_list
+    ]
+    assert [len(batch) for batch in batches] == [MAX_METRIC_QUERIES, 1]
+    assert batches[1][0]["MetricStat"]["Metric"]["Dimensions"][0]["Value"] == INSTANCE_IDS[-1]
+
+@pytest.mark.asyncio
+async def test_recommendations_without_cloudwatch(optimizer):
+    """Test that a CloudWatch failure keeps all recommendations."""
+    optimizer.cloudwatch.get_paginator.return_value.paginate.side_effect = ClientError(
+        {"Error": {"Code": "AccessDenied", "Message": "AccessDenied"}}, "GetMetricData"
+    )
+    ec2_pages = {
+        "describe_instances": pages({"Reservations": [{"Instances": [
+            {"InstanceId": "i-0001", "State": {"Name": "running"}},
+            {"InstanceId": "i-0002", "State": {"Name": "stopped"}}
+        ]}]}),
+        "describe_volumes": pages({"Volumes": [{"VolumeId": "vol-1", "Size": 100}]})
+    }
+    optimizer.ec2.get_paginator.side_effect = ec2_pages.get
+    optimizer.rds.get_paginator.return_value = pages(
+        {"DBInstances": [{"DBInstanceIdentifier": "db-1"}]}
+    )
+    
+    recommendations = await optimizer.get_optimization_recommendations()
+    
+    assert [(rec["type"], rec["resource_id"]) for rec in recommendations] == [
+        ("EC2", "i-0001"), ("EBS", "vol-1"), ("RDS", "db-1")
+    ]
+    assert recommendations[0]["recommendation"] == "Review if this instance is needed"
+    assert recommendations[1]["potential_savings"] == "$10.00/month"
+
+@pytest.mark.asyncio
+async def test_analyze_current_costs_follows_pages(optimizer):
+    """Test that Cost Explorer pages are concatenated and their costs summed."""
+    def group(amount):
+        return {"Metrics": {"UnblendedCost": {"Amount": amount}}}
+    
+    first = {"TimePeriod": {"Start": "2024-01-01"}, "Groups": [group("1.50"), group("2.25")]}
+    second = {"TimePeriod": {"Start": "2024-01-01"}, "Groups": [group("0.25")]}
+    optimizer.cost_explorer.get_cost_and_usage.side_effect = [
+        {"ResultsByTime": [first], "NextPageToken": "page-2"},
+        {"ResultsByTime": [second]}
+    ]
+    time_period = {"Start": "2024-01-01", "End": "2024-02-01"}
+    
+    analysis = await optimizer.analyze_current_costs(time_period)
+    
+    assert analysis == {"costs": [first, second], "total": 4.0}
+    calls = optimizer.cost_explorer.get_cost_and_usage.call_args_list
+    assert "NextPageToken" not in calls[0].kwargs
+    assert calls[1].kwargs["NextPageToken"] == "page-2"
+    assert calls[1].kwargs["TimePeriod"] == time_period
@@ -5,7 +5,7 @@ Tests for the Input Processor module.
 import pytest
 from autoops_aws.input_processor import InputProcessor
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def input_processor():
     """Create an InputProcessor instance for testing."""
     return InputProcessor()
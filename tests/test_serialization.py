@@ -0,0 +1,44 @@
+"""
+Tests for the serialization module.
+"""
+
+import sys
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+
+import pytest
+from autoops_aws import serialization
+from autoops_aws.cli.command import Command, CommandType
+
+@dataclass
+class Finding:
+    """Dataclass with a private field, like Command's string cache."""
+    resource_id: str
+    found_on: date
+    _note: str = "internal"
+    severity: str = field(default="low", init=False)
+
+def test_json_fallback_matches_orjson(monkeypatch):
+    """Test that both encoders produce the same bytes."""
+    pytest.importorskip("orjson")
+    orjson_dumps = serialization._load_dumps()
+    
+    # A None entry in sys.modules makes "import orjson" raise ImportError
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    json_dumps = serialization._load_dumps()
+    
+    command = Command(CommandType.AWS, "s3", "list-buckets", {"Bucket": "données"})
+    command.approve("admin")
+    str(command)
+    
+    finding = Finding("sg-1", date(2024, 1, 2))
+    finding.severity = "high"
+    
+    payload = {
+        "command": command,
+        "findings": [finding, Finding("sg-2", date(2024, 1, 3))],
+        "generated_at": datetime(2024, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc),
+        "type": CommandType.HELP,
+        1: [1, 2.5, None, True],
+    }
+    assert json_dumps(payload) == orjson_dumps(payload)